@@ -1,861 +1,1514 @@
-"""
-Simple Food Weight Detection System with ST7789 Display - Hardware Module
-HX711 Weight Sensor + ST7789 Display + Serial Communication
-
-Features:
-- HX711 weight sensor interface with error handling
-- ST7789 240x240 color display for real-time information
-- Display AI analysis results, weight, and carbon footprint
-- Simple text-based serial communication
-- Autonomous weight monitoring and sending
-"""
-
-from machine import Pin, SPI
-from hx711_gpio import HX711
-import time
-import gc
-import st7789
-import vga1_16x32 as font
-
-# =========================================
-# HARDWARE CONFIGURATION
-# =========================================
-
-# HX711 Weight Sensor
-PIN_DATA = 8      # HX711 data pin (DOUT)
-PIN_CLOCK = 9     # HX711 clock pin (SCK)
-
-# ST7789 Display Configuration
-WIDTH, HEIGHT = 240, 240
-SPI_NUM = 0       # SPI bus number
-BACKLIGHT_PIN = 0 # Display backlight pin
-RST_PIN = 13      # Display reset pin
-DC_PIN = 12       # Display data/command pin
-CS_PIN = 1        # Display chip select pin
-SCK_PIN = 18      # SPI clock pin (SCL)
-MOSI_PIN = 19     # SPI data pin (SDA)
-
-# Sensor Configuration
-CALIBRATION_FACTOR = 419.0  # Calibration factor (unit: LSB/g)
-STABILITY_THRESHOLD = 5.0   # Weight stability threshold (grams)
-RAPID_SAMPLE_COUNT = 5      # Number of rapid samples for stabilization
-RAPID_SAMPLE_INTERVAL = 0.05  # Interval between rapid samples (seconds)
-WARMUP_SAMPLES = 10         # Number of warmup samples during initialization
-
-# Weight sending configuration
-MIN_WEIGHT_THRESHOLD = 5.0  # Minimum weight to consider (grams)
-WEIGHT_CHANGE_THRESHOLD = 2.0  # Minimum weight change to trigger new send (grams)
-TIME_BETWEEN_SENDS = 5.0    # Minimum time between sends (seconds)
-
-# Initialize SPI and Display
-spi = SPI(SPI_NUM, baudrate=31250000, sck=Pin(SCK_PIN), mosi=Pin(MOSI_PIN))
-tft = st7789.ST7789(
-    spi, WIDTH, HEIGHT,
-    reset=Pin(RST_PIN, Pin.OUT),
-    cs=Pin(CS_PIN, Pin.OUT),
-    dc=Pin(DC_PIN, Pin.OUT),
-    backlight=Pin(BACKLIGHT_PIN, Pin.OUT),
-    rotation=0,
-)
-
-
-class DisplayManager:
-    """
-    ST7789 Display Manager for showing AI analysis results and system status
-    """
-    
-    def __init__(self, tft_display):
-        """Initialize display manager"""
-        self.tft = tft_display
-        self.font = font
-        
-        # Redesigned display areas layout (240x240 pixels)
-        self.header_area = (0, 0, 240, 30)      # System title (smaller)
-        self.weight_area = (0, 35, 240, 65)     # Weight display
-        self.carbon_area = (0, 70, 240, 100)    # Carbon footprint (moved up)
-        self.food_area = (0, 105, 240, 135)     # Food name
-        self.confidence_area = (0, 140, 240, 165) # AI confidence
-        self.impact_area = (0, 170, 240, 195)   # Environmental impact
-        self.status_area = (0, 200, 240, 230)   # System status
-        self.footer_area = (0, 230, 240, 240)   # Time/info
-        
-        # Colors
-        self.BLACK = st7789.BLACK
-        self.WHITE = st7789.WHITE
-        self.RED = st7789.RED
-        self.GREEN = st7789.GREEN
-        self.BLUE = st7789.BLUE
-        self.YELLOW = st7789.YELLOW
-        self.CYAN = st7789.CYAN
-        self.MAGENTA = st7789.MAGENTA
-        
-        # Current display state
-        self.current_weight = 0.0
-        self.current_food = ""
-        self.current_carbon = 0.0
-        self.current_status = "Initializing..."
-        self.ai_result_received = False
-        
-        # Initialize display
-        self.init_display()
-    
-    def init_display(self):
-        """Initialize display with simple welcome screen"""
-        print("Initializing ST7789 Display...")
-        
-        # Clear screen
-        self.tft.fill(self.BLACK)
-        
-        # Simple startup screen with centered text
-        self.draw_text_centered("Carbon Emission", 40, self.WHITE)
-        self.draw_text_centered("Detection", 70, self.WHITE)
-        self.draw_text_centered("System", 110, self.CYAN)
-        self.draw_text_centered("Starting...", 140, self.YELLOW)
-        self.draw_text_centered("Place food on", 170, self.GREEN)
-        self.draw_text_centered("scale to start", 200, self.GREEN)
-        
-        print("Display initialized successfully")
-    
-    def draw_text_centered(self, text, y, color):
-        """Draw text centered horizontally at given y position"""
-        try:
-            # Calculate approximate text width (16 pixels per character for this font)
-            text_width = len(text) * 16
-            x = max(0, (WIDTH - text_width) // 2)
-            self.tft.text(self.font, text, x, y, color, self.BLACK)
-        except Exception as e:
-            print(f"Text draw error: {e}")
-    
-    def draw_text_area(self, text, area, color, bg_color=None):
-        """Draw text in specified area with background"""
-        try:
-            x, y, w, h = area
-            
-            if bg_color is not None:
-                self.tft.fill_rect(x, y, w, h, bg_color)
-            
-            # Center text in area
-            text_width = len(text) * 16
-            text_x = x + max(0, (w - text_width) // 2)
-            text_y = y + (h - 32) // 2  # Font height is 32
-            
-            self.tft.text(self.font, text, text_x, text_y, color, bg_color or self.BLACK)
-            
-        except Exception as e:
-            print(f"❌ Text draw error: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def update_weight(self, weight, is_stable=False):
-        """Update weight display - simple and clear"""
-        self.current_weight = weight
-        
-        # Clear screen
-        self.tft.fill(self.BLACK)
-        
-        # Choose color based on stability
-        color = self.GREEN if is_stable else self.YELLOW
-        
-        # Format weight text
-        if weight > 1000:
-            weight_text = f"Weight: {weight/1000:.2f}kg"
-        else:
-            weight_text = f"Weight: {weight:.1f}g"
-        
-        # Display weight prominently
-        self.draw_text_centered(weight_text, 60, color)
-        
-        # Show status
-        status_text = "STABLE - Ready for Analysis" if is_stable else "MEASURING..."
-        status_color = self.GREEN if is_stable else self.YELLOW
-        self.draw_text_centered(status_text, 100, status_color)
-        
-        # Show instruction for carbon footprint area
-        self.draw_text_centered("Waiting for AI Analysis", 140, self.CYAN)
-        self.draw_text_centered("Carbon footprint will", 170, self.WHITE)
-        self.draw_text_centered("appear here", 190, self.WHITE)
-    
-    def update_carbon_display(self):
-        """Update carbon footprint display in dedicated area"""
-        if self.current_carbon <= 0:
-            return
-            
-        # Format carbon text
-        if self.current_carbon > 1000:
-            carbon_text = f"{self.current_carbon/1000:.2f}kg CO2"
-        else:
-            carbon_text = f"{self.current_carbon:.1f}g CO2"
-        
-        # Choose color based on carbon amount
-        if self.current_carbon < 100:
-            color = self.GREEN
-        elif self.current_carbon < 500:
-            color = self.YELLOW
-        elif self.current_carbon < 1000:
-            color = st7789.color565(255, 165, 0)  # Orange
-        else:
-            color = self.RED
-        
-        # Update carbon display
-        self.draw_text_area(carbon_text, self.carbon_area, color, self.BLACK)
-    
-    def update_food_info(self, food_name, confidence=0.0):
-        """Update food information display"""
-        self.current_food = food_name
-        
-        # Choose color based on confidence
-        if confidence > 0.8:
-            color = self.GREEN
-        elif confidence > 0.5:
-            color = self.YELLOW
-        else:
-            color = self.RED
-        
-        # Truncate long food names to fit display
-        display_name = food_name[:14] if len(food_name) > 14 else food_name
-        
-        self.draw_text_area(display_name, self.food_area, color, self.BLACK)
-        
-        # Show confidence if available
-        if confidence > 0:
-            conf_text = f"({confidence*100:.0f}%)"
-            self.tft.text(self.font, conf_text, 10, 110, self.WHITE, self.BLACK)
-    
-    def update_carbon_footprint(self, carbon_value, unit="g CO2"):
-        """Update carbon footprint display"""
-        self.current_carbon = carbon_value
-        
-        # Format carbon value
-        if carbon_value > 1000:
-            carbon_text = f"{carbon_value/1000:.2f}kg CO2"
-        else:
-            carbon_text = f"{carbon_value:.1f}g CO2"
-        
-        # Use red color for high emissions, green for low
-        color = self.RED if carbon_value > 100 else self.GREEN if carbon_value < 50 else self.YELLOW
-        
-        self.draw_text_area(carbon_text, self.carbon_area, color, self.BLACK)
-    
-    def update_status(self, status, color=None):
-        """Update system status display"""
-        self.current_status = status
-        display_color = color or self.WHITE
-        
-        # Truncate long status messages
-        display_status = status[:18] if len(status) > 18 else status
-        
-        self.draw_text_area(display_status, self.status_area, display_color, self.BLACK)
-    
-    def show_ai_analysis(self, food_name, confidence, carbon_footprint):
-        """Display complete AI analysis result"""
-        print(f"Displaying AI result: {food_name}, confidence: {confidence}, carbon: {carbon_footprint}")
-        
-        # Clear previous AI result area
-        self.tft.fill_rect(0, 90, 240, 85, self.BLACK)
-        
-        # Update food name
-        self.update_food_info(food_name, confidence)
-        
-        # Update carbon footprint
-        self.update_carbon_footprint(carbon_footprint)
-        
-        # Update status
-        self.update_status("AI Analysis Complete", self.GREEN)
-        
-        self.ai_result_received = True
-    
-    def display_analysis_result(self, food_name, confidence, weight, co2_grams, impact_level):
-        """Display complete AI analysis result - simple and clear"""
-        print(f"🎯 Displaying analysis: {food_name}, {confidence}%, {weight}g, {co2_grams}g CO2, {impact_level}")
-        print("🛑 Setting AI result flag - stopping weight updates")
-        
-        # Store current state first
-        self.current_food = food_name
-        self.current_carbon = co2_grams
-        self.current_weight = weight
-        self.ai_result_received = True
-        
-        # Clear screen completely
-        self.tft.fill(self.BLACK)
-        
-        # Display weight at top
-        if weight > 1000:
-            weight_text = f"Weight: {weight/1000:.2f}kg"
-        else:
-            weight_text = f"Weight: {weight:.1f}g"
-        self.draw_text_centered(weight_text, 30, self.GREEN)
-        
-        # Display AI prediction prominently 
-        prediction_text = f"AI: {food_name[:8]}"
-        self.draw_text_centered(prediction_text, 80, self.CYAN)
-        
-        # Display carbon footprint prominently in center
-        if co2_grams > 1000:
-            carbon_text = f"CO2: {co2_grams/1000:.2f}kg"
-        else:
-            carbon_text = f"CO2: {co2_grams:.1f}g"
-        
-        # Color based on impact
-        if impact_level == "LOW":
-            co2_color = self.GREEN
-        elif impact_level == "MEDIUM":
-            co2_color = self.YELLOW
-        elif impact_level == "HIGH":
-            co2_color = st7789.color565(255, 165, 0)  # Orange
-        else:  # VERY_HIGH
-            co2_color = self.RED
-        
-        print(f"💚 Drawing carbon footprint: {carbon_text} in center")
-        # Display carbon prominently in center
-        self.draw_text_centered(carbon_text, 130, co2_color)
-        
-        # Display impact level at bottom
-        impact_text = f"Impact: {impact_level}"
-        self.draw_text_centered(impact_text, 170, co2_color)
-        
-        print("✅ Analysis result displayed on screen")
-    
-    def draw_text_left(self, text, x, y, color):
-        """Draw text at specified position"""
-        try:
-            self.tft.text(self.font, text, x, y, color, self.BLACK)
-        except Exception as e:
-            print(f"Text draw error: {e}")
-    
-    def show_waiting_for_ai(self):
-        """Show waiting for AI analysis message"""
-        self.update_status("Waiting for AI...", self.CYAN)
-        self.tft.fill_rect(0, 90, 240, 85, self.BLACK)  # Clear food/carbon area
-        self.draw_text_centered("Analyzing food...", 110, self.CYAN)
-    
-    def show_system_ready(self):
-        """Show system ready message"""
-        self.tft.fill(self.BLACK)
-        self.draw_text_centered("System Ready", 60, self.GREEN)
-        self.draw_text_centered("Place food on", 100, self.WHITE)
-        self.draw_text_centered("scale for analysis", 120, self.WHITE)
-        self.update_status("Ready", self.GREEN)
-    
-    def show_error(self, error_msg):
-        """Show error message"""
-        self.update_status(f"ERROR: {error_msg}", self.RED)
-    
-    def refresh_display(self):
-        """Refresh the entire display with current values"""
-        try:
-            # Header
-            self.draw_text_centered("Carbon Detection", 5, self.WHITE)
-            
-            # Current values
-            self.update_weight(self.current_weight)
-            if self.current_food:
-                self.update_food_info(self.current_food)
-            if self.current_carbon > 0:
-                self.update_carbon_footprint(self.current_carbon)
-            self.update_status(self.current_status)
-            
-        except Exception as e:
-            print(f"Display refresh error: {e}")
-
-
-class ResultReceiver:
-    """Receive and parse AI analysis results from PC"""
-    
-    def __init__(self, display_manager):
-        self.display = display_manager
-        self.buffer = ""
-        
-    def process_serial_input(self, line):
-        """Process incoming serial data from PC"""
-        try:
-            line = line.strip()
-            print(f"📨 Received: {line}")
-            
-            # Parse AI result message: AI_RESULT:food:confidence:weight:co2:impact
-            if line.startswith("AI_RESULT:"):
-                print("🤖 Processing AI result...")
-                parts = line.split(":")
-                
-                if len(parts) >= 6:
-                    _, food_name, confidence, weight, co2_grams, impact_level = parts[:6]
-                    
-                    # Convert to appropriate types
-                    confidence = float(confidence)  # Keep as float to handle decimals
-                    weight = float(weight)
-                    co2_grams = float(co2_grams)
-                    
-                    print(f"✅ Parsed: {food_name} ({confidence}%) - {weight}g - {co2_grams}g CO2")
-                    
-                    # Set flag to stop weight updates and display AI result
-                    print("🛑 Stopping weight updates for AI result display")
-                    self.display.ai_result_received = True
-                    
-                    # Display on screen
-                    self.display.display_analysis_result(
-                        food_name, confidence, weight, co2_grams, impact_level
-                    )
-                    
-                    return True
-                else:
-                    print(f"❌ Invalid AI_RESULT format - expected 6+ parts, got {len(parts)}")
-            
-            return False
-            
-        except Exception as e:
-            print(f"❌ Error processing serial input: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-
-
-class WeightSensor:
-    """
-    Simplified HX711 weight sensor interface with simulation fallback
-    """
-    
-    def __init__(self, data_pin=PIN_DATA, clock_pin=PIN_CLOCK):
-        """Initialize the weight sensor with retry and fallback"""
-        print("Initializing HX711 Weight Sensor...")
-        
-        self._tare_offset = 0.0
-        self._last_stable_weight = 0.0
-        self._is_initialized = False
-        self._simulation_mode = False
-        self._sim_weight = 0.0
-        
-        # Try to initialize HX711 with retries
-        for attempt in range(3):
-            try:
-                print(f"HX711 initialization attempt {attempt + 1}...")
-                
-                # Configure GPIO pins
-                self._pin_data = Pin(data_pin, Pin.IN, pull=Pin.PULL_DOWN)
-                self._pin_clock = Pin(clock_pin, Pin.OUT)
-                
-                # Initialize HX711 driver
-                self._hx711 = HX711(self._pin_clock, self._pin_data)
-                
-                # Test reading
-                test_value = self._hx711.get_value()
-                print(f"Test reading: {test_value}")
-                
-                print("HX711 initialization successful!")
-                self._is_initialized = True
-                break
-                
-            except Exception as e:
-                print(f"HX711 init attempt {attempt + 1} failed: {e}")
-                time.sleep(1)
-        
-        # If HX711 failed, use simulation mode
-        if not self._is_initialized:
-            print("WARNING: HX711 initialization failed - using SIMULATION MODE")
-            print("System will generate simulated weight data for testing")
-            self._simulation_mode = True
-            self._is_initialized = True
-    
-    def warmup(self):
-        """Warmup the sensor by performing dummy readings"""
-        if self._simulation_mode:
-            print("Simulation mode - skipping warmup")
-            return
-            
-        print("Warming up sensor...")
-        for _ in range(WARMUP_SAMPLES):
-            try:
-                self._hx711.get_value()
-                time.sleep(0.05)
-            except:
-                break
-        print("Sensor warmup complete")
-    
-    def calibrate_zero(self, samples=20):
-        """Calibrate the zero point (tare) of the scale"""
-        print("Zero Point Calibration")
-        print("Please ensure the scale is empty")
-        
-        if self._simulation_mode:
-            print("Simulation mode - using default zero offset")
-            self._tare_offset = 0.0
-            self._is_initialized = True
-            print("Calibration complete (simulated)")
-            return
-        
-        # Countdown
-        for i in range(3, 0, -1):
-            print(f"Starting in {i}...")
-            time.sleep(1)
-        
-        # Warmup before calibration
-        self.warmup()
-        
-        print("Calibrating...")
-        
-        try:
-            # Perform HX711 tare operation
-            self._hx711.tare()
-            
-            # Collect samples for accurate zero point
-            tare_samples = []
-            for i in range(samples):
-                reading = self._hx711.get_value()
-                tare_samples.append(reading)
-                if i % 5 == 0:
-                    print(f"  Progress: {i}/{samples}")
-                time.sleep(0.05)
-            
-            # Calculate robust average (remove outliers)
-            tare_samples.sort()
-            trim_count = samples // 5  # Remove top and bottom 20%
-            trimmed_samples = tare_samples[trim_count:-trim_count] if trim_count > 0 else tare_samples
-            self._tare_offset = sum(trimmed_samples) / len(trimmed_samples)
-            
-            print(f"Calibration complete - Zero offset: {self._tare_offset:.0f} LSB")
-            
-        except Exception as e:
-            print(f"Calibration error: {e}")
-            print("Using default zero offset")
-            self._tare_offset = 0.0
-    
-    def get_raw_value(self):
-        """Get raw ADC value from HX711"""
-        try:
-            if self._simulation_mode:
-                # Return simulated raw value
-                return int(self._sim_weight * CALIBRATION_FACTOR + self._tare_offset)
-            return self._hx711.get_value()
-        except Exception as e:
-            print(f"Raw value error: {e}")
-            raise e  # Re-raise the exception
-    
-    def get_weight_fast(self):
-        """
-        Get weight measurement with fast stabilization algorithm
-        
-        Returns:
-            tuple: (weight in grams, is_stable boolean)
-        """
-        if not self._is_initialized:
-            print("ERROR: Sensor not calibrated")
-            return 0.0, False
-        
-        if self._simulation_mode:
-            # Simulate weight changes for testing
-            try:
-                import time
-                cycle_time = int(time.time()) % 30  # 30-second cycle
-                
-                if cycle_time < 10:
-                    self._sim_weight = 0.0  # Empty scale
-                elif cycle_time < 20:
-                    self._sim_weight = 125.0 + (cycle_time % 3) * 2  # Stable weight with small variation
-                else:
-                    self._sim_weight = 80.0 + cycle_time  # Changing weight
-                
-                # Simulate stability based on weight change
-                weight_change = abs(self._sim_weight - self._last_stable_weight)
-                is_stable = weight_change < STABILITY_THRESHOLD and self._sim_weight > MIN_WEIGHT_THRESHOLD
-                
-                if is_stable:
-                    self._last_stable_weight = self._sim_weight
-                
-                return self._sim_weight, is_stable
-            except Exception as e:
-                print(f"Simulation error: {e}")
-                return 0.0, False
-        
-        # Real sensor measurement - initialize ALL variables first
-        samples = []
-        median_weight = 0.0
-        is_stable = False
-        sample_range = 0.0
-        weight_change = 0.0
-        
-        try:
-            # Collect rapid samples with individual error handling
-            for i in range(RAPID_SAMPLE_COUNT):
-                try:
-                    raw_value = self.get_raw_value()
-                    weight = (raw_value - self._tare_offset) / CALIBRATION_FACTOR
-                    samples.append(weight)
-                except Exception as e:
-                    print(f"Sample {i} error: {e}")
-                    # Use last known weight if available
-                    if samples:
-                        samples.append(samples[-1])
-                    else:
-                        samples.append(0.0)
-                
-                try:
-                    time.sleep(RAPID_SAMPLE_INTERVAL)
-                except:
-                    pass  # Ignore sleep errors
-            
-            # Ensure we have samples
-            if not samples:
-                print("ERROR: No samples collected")
-                return 0.0, False
-            
-            # Analyze sample stability
-            try:
-                sample_range = max(samples) - min(samples)
-            except:
-                sample_range = 0.0
-            
-            # Calculate median for robustness
-            try:
-                samples.sort()
-                median_weight = samples[len(samples) // 2]
-            except:
-                median_weight = 0.0
-            
-            # If readings are highly variable, weight is changing
-            if sample_range > 50.0:  # Large variation threshold
-                return median_weight, False
-            
-            # Check stability against last stable reading
-            try:
-                weight_change = abs(median_weight - self._last_stable_weight)
-                is_stable = weight_change < STABILITY_THRESHOLD
-            except:
-                is_stable = False
-            
-            # Update stable weight if significant change detected
-            try:
-                if not is_stable and sample_range < 10.0:  # New stable weight
-                    self._last_stable_weight = median_weight
-            except:
-                pass
-            
-            # Return appropriate weight
-            try:
-                if is_stable:
-                    return self._last_stable_weight, True
-                else:
-                    return median_weight, False
-            except:
-                return 0.0, False
-            
-        except Exception as e:
-            print(f"Weight reading error: {e}")
-            return 0.0, False
-
-
-class SimpleWeightSystem:
-    """
-    Main system controller - simplified version
-    """
-    
-    def __init__(self):
-        """Initialize the simplified system"""
-        print("=== Simple Food Weight Detection System ===")
-        print("Hardware Module - Raspberry Pi Pico + ST7789")
-        print("Weight sensing + AI analysis display")
-        print()
-        
-        # Initialize display manager
-        self.display = DisplayManager(tft)
-        
-        # Initialize weight sensor
-        self.weight_sensor = WeightSensor()
-        
-        # Initialize result receiver
-        self.result_receiver = ResultReceiver(self.display)
-        
-        # System state for weight monitoring
-        self.last_sent_weight = 0.0
-        self.last_sent_time = 0
-        
-        # AI analysis state
-        self.current_ai_result = None
-        self.waiting_for_ai = False
-        
-        print("System initialization complete")
-    
-    def initialize(self):
-        """Initialize and calibrate the system"""
-        try:
-            # Calibrate weight sensor
-            self.weight_sensor.calibrate_zero()
-            
-            print("System ready for operation")
-            print("Starting autonomous weight monitoring...")
-            
-        except Exception as e:
-            print(f"Initialization error: {e}")
-    
-    def send_weight_message(self, weight, is_stable):
-        """Send weight data using simple text protocol"""
-        try:
-            # Format: WEIGHT:123.5:STABLE or WEIGHT:123.5:CHANGING
-            stability_text = "STABLE" if is_stable else "CHANGING"
-            message = f"WEIGHT:{weight:.1f}:{stability_text}"
-            
-            # Send via USB serial (print function)
-            print(message)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Send error: {e}")
-            return False
-    
-    def send_status_message(self):
-        """Send system status message"""
-        try:
-            current_weight, is_stable = self.weight_sensor.get_weight_fast()
-            mode = "SIMULATION" if self.weight_sensor._simulation_mode else "REAL"
-            message = f"STATUS:READY:MODE:{mode}:WEIGHT:{current_weight:.1f}"
-            print(message)
-        except Exception as e:
-            print(f"Status error: {e}")
-    
-    def check_pc_input(self):
-        """Check for incoming data from PC - MicroPython compatible"""
-        try:
-            # For MicroPython, use UART or simple polling
-            import sys
-            
-            # Check if there's any input available
-            if hasattr(sys.stdin, 'any'):
-                # MicroPython style
-                if sys.stdin.any():
-                    line = sys.stdin.readline().strip()
-                    if line:
-                        print(f"Received input: {line}")
-                        self.result_receiver.process_serial_input(line)
-            else:
-                # Try standard Python approach (for testing)
-                try:
-                    import select
-                    if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-                        line = sys.stdin.readline().strip()
-                        if line:
-                            print(f"Received input: {line}")
-                            self.result_receiver.process_serial_input(line)
-                except:
-                    pass
-                    
-        except Exception as e:
-            # Silent fail for input checking
-            pass
-    
-    def run(self):
-        """Main system loop - continuous weight monitoring"""
-        print("Starting autonomous weight monitoring system...")
-        print("Weight will be sent automatically when detected!")
-        print()
-        
-        # Weight monitoring state
-        stable_count = 0
-        required_stable = 3  # Need 3 consecutive stable readings
-        loop_counter = 0
-        
-        # Send initial status
-        self.send_status_message()
-        
-        try:
-            while True:
-                loop_counter += 1
-                
-                # Show loop activity every 500 iterations (about every 100 seconds)
-                if loop_counter % 500 == 0:
-                    print(f"MSG:LOOP:{loop_counter}:MONITORING")
-                
-                try:
-                    # Check for incoming PC data
-                    self.check_pc_input()
-                    
-                    # Get current weight
-                    weight, is_stable = self.weight_sensor.get_weight_fast()
-                    current_time = time.time()
-                    
-                    # Only update display with current weight if no AI result is being displayed
-                    if not self.display.ai_result_received:
-                        self.display.update_weight(weight, is_stable)
-                    else:
-                        # AI result is being displayed - skip weight updates
-                        if loop_counter % 50 == 0:  # Print every 10 seconds
-                            print(f"🔒 AI result displayed - skipping weight update ({weight:.1f}g)")
-                    
-                    # Check if weight is significant
-                    if weight > MIN_WEIGHT_THRESHOLD:
-                        if is_stable:
-                            stable_count += 1
-                            
-                            # Check if we have enough stable readings
-                            if stable_count >= required_stable:
-                                # Check if this is a new weight worth sending
-                                weight_diff = abs(weight - self.last_sent_weight)
-                                time_diff = current_time - self.last_sent_time
-                                
-                                # Send if weight changed significantly or enough time passed
-                                should_send = (
-                                    weight_diff > WEIGHT_CHANGE_THRESHOLD or 
-                                    self.last_sent_time == 0 or 
-                                    time_diff > TIME_BETWEEN_SENDS
-                                )
-                                
-                                if should_send:
-                                    success = self.send_weight_message(weight, True)
-                                    if success:
-                                        self.last_sent_weight = weight
-                                        self.last_sent_time = current_time
-                                        print(f"MSG:SENT:WEIGHT:{weight:.1f}g")
-                                
-                                stable_count = 0  # Reset counter
-                        else:
-                            stable_count = 0
-                            
-                        # Show current reading every 50 loops when weight detected
-                        if loop_counter % 50 == 0:
-                            status = "STABLE" if is_stable else "CHANGING"
-                            print(f"MSG:CURRENT:{weight:.1f}g:{status}")
-                            
-                    else:
-                        # No significant weight - reset AI result display if weight is very low
-                        stable_count = 0
-                        if weight < 5.0 and self.display.ai_result_received:
-                            print("Weight removed - resetting to live weight display")
-                            self.display.ai_result_received = False
-                            self.display.current_carbon = 0.0
-                            self.display.current_food = ""
-                            # Show live weight display again
-                            self.display.update_weight(weight, is_stable)
-                    
-                    # Memory management
-                    if loop_counter % 100 == 0:
-                        gc.collect()
-                    
-                    # Small delay
-                    time.sleep(0.2)  # 5 readings per second
-                    
-                except Exception as e:
-                    print(f"ERROR:WEIGHT_MONITORING:{e}")
-                    time.sleep(1)
-                
-        except KeyboardInterrupt:
-            print("MSG:SYSTEM:STOPPED_BY_USER")
-        except Exception as e:
-            print(f"ERROR:SYSTEM:{e}")
-
-
-def main():
-    """Main application entry point"""
-    try:
-        # Create and initialize system
-        system = SimpleWeightSystem()
-        system.initialize()
-        
-        # Run main loop
-        system.run()
-        
-    except Exception as e:
-        print(f"ERROR:FATAL:{e}")
-
-
-if __name__ == "__main__":
-    main()
-
-
-
+"""
+Simple Food Weight Detection System with ST7789 Display - Hardware Module
+HX711 Weight Sensor + ST7789 Display + Serial Communication
+
+Features:
+- HX711 weight sensor interface with error handling
+- ST7789 240x240 color display for real-time information
+- Display AI analysis results, weight, and carbon footprint
+- Simple text-based serial communication
+- Autonomous weight monitoring and sending
+"""
+
+from machine import Pin, SPI, mem32
+from hx711_gpio import HX711
+import sys
+import time
+import gc
+import array
+import framebuf
+import micropython
+from micropython import const
+import st7789
+import vga1_16x32 as font
+
+# DMA display flushes need the rp2 module (RP2040) with rp2.DMA
+# (MicroPython 1.22+)
+try:
+    import rp2
+except ImportError:
+    rp2 = None
+DMA_AVAILABLE = rp2 is not None and hasattr(rp2, "DMA")
+
+# =========================================
+# HARDWARE CONFIGURATION
+# =========================================
+
+# HX711 Weight Sensor
+PIN_DATA = 8      # HX711 data pin (DOUT)
+PIN_CLOCK = 9     # HX711 clock pin (SCK)
+HX711_PIO_SM = 0  # PIO state machine the HX711 driver clocks the chip with
+
+# ST7789 Display Configuration
+WIDTH, HEIGHT = 240, 240
+SPI_NUM = 0       # SPI bus number
+BACKLIGHT_PIN = 0 # Display backlight pin
+RST_PIN = 13      # Display reset pin
+DC_PIN = 12       # Display data/command pin
+CS_PIN = 1        # Display chip select pin
+SCK_PIN = 18      # SPI clock pin (SCL)
+MOSI_PIN = 19     # SPI data pin (SDA)
+
+# RP2040 SPI register blocks and TX DMA request lines, indexed by SPI_NUM
+SPI_BASE = (0x4003C000, 0x40040000)
+SPI_TX_DREQ = (16, 18)
+SPI_DR = 0x08     # Data register offset
+SPI_SR = 0x0C     # Status register offset (bit 2 RNE, bit 4 BSY)
+SPI_ICR = 0x20    # Interrupt clear register offset (bit 0 clears RX overrun)
+
+# Sensor Configuration
+CALIBRATION_FACTOR = 419.0  # Calibration factor (unit: LSB/g)
+STABILITY_THRESHOLD = 5.0   # Weight stability threshold (grams)
+RAPID_SAMPLE_COUNT = 5      # Number of rapid samples for stabilization
+RAPID_SAMPLE_INTERVAL = 0.05  # Interval between rapid samples (seconds)
+WARMUP_SAMPLES = 10         # Number of warmup samples during initialization
+TARE_OUTLIER_K = 2.0        # Tare samples beyond K mean deviations are rejected
+TARE_CHECK_SAMPLES = 5      # Readings used to check a zero saved by an earlier boot
+TARE_REUSE_GRAMS = 2.0      # Max drift from the saved zero before recalibrating (grams)
+HX711_STALE_MS = const(2000)  # Reset the HX711 after this long without a reading (ms)
+HEALTH_CHECK_LOOPS = const(10)  # Main loop iterations between HX711 health checks
+
+# Weight sending configuration
+MIN_WEIGHT_THRESHOLD = 5.0  # Minimum weight to consider (grams)
+WEIGHT_CHANGE_THRESHOLD = 2.0  # Minimum weight change to trigger new send (grams)
+WEIGHT_REDRAW_THRESHOLD = 0.5  # Minimum weight change to redraw the live display (grams)
+SETTLE_WINDOW = 8           # Recent readings checked before sending (power of two)
+SETTLE_RANGE = 2.0          # Max spread of those readings for a settled weight (grams)
+TIME_BETWEEN_SENDS = const(5000)  # Minimum time between sends (milliseconds)
+LOOP_PERIOD_MS = const(200)  # Main loop cadence: 5 readings per second
+
+# Memory management
+GC_INTERVAL = const(100)    # Loops between heap checks
+GC_LOW_MEMORY = const(8192)  # Collect at a heap check only below this many free bytes
+GC_DEBUG = False            # Print heap usage around scheduled collections
+
+# Serial input
+SERIAL_LINE_MAX = 128       # Longest PC message kept (bytes); extra is dropped
+RESULT_CACHE_SIZE = 16      # Parsed AI results remembered; cleared when full
+
+# Serial protocol frames, built once instead of per message; weights are
+# filled in from integer decigrams (see _decigrams)
+WEIGHT_FRAMES = {True: "WEIGHT:%s%d.%d:STABLE\n", False: "WEIGHT:%s%d.%d:CHANGING\n"}
+CURRENT_MESSAGES = {True: "MSG:CURRENT:%s%d.%dg:STABLE", False: "MSG:CURRENT:%s%d.%dg:CHANGING"}
+SENT_MESSAGE = "MSG:SENT:WEIGHT:%s%d.%dg"
+
+# Log templates for an AI result, each written with a single call
+AI_RESULT_LOG = (
+    "📨 Received: %s\n"
+    "🤖 Processing AI result...\n"
+    "✅ Parsed: %s (%s%%) - %sg - %sg CO2\n"
+    "🛑 Stopping weight updates for AI result display\n"
+)
+AI_RESULT_REPEAT_LOG = "📨 Received: %s\n✅ AI result already displayed\n"
+AI_RESULT_INVALID_LOG = "📨 Received: %s\n❌ Invalid AI_RESULT format - expected 6+ parts, got %d\n"
+ANALYSIS_START_LOG = (
+    "🎯 Displaying analysis: %s, %s%%, %sg, %sg CO2, %s\n"
+    "🛑 Setting AI result flag - stopping weight updates\n"
+)
+ANALYSIS_DONE_LOG = "💚 Drew carbon footprint: %s in center\n✅ Analysis result displayed on screen\n"
+AI_RESULT_PREFIX = "AI_RESULT:"
+AI_RESULT_FIELDS = len(AI_RESULT_PREFIX)  # Offset of the first field
+
+# Display text formats for masses: (grams, kilograms above 1000 g)
+WEIGHT_FORMATS = ("Weight: %.1fg", "Weight: %.2fkg")
+CO2_FORMATS = ("%.1fg CO2", "%.2fkg CO2")
+CO2_LABEL_FORMATS = ("CO2: %.1fg", "CO2: %.2fkg")
+
+# Initialize SPI and Display
+spi = SPI(SPI_NUM, baudrate=31250000, sck=Pin(SCK_PIN), mosi=Pin(MOSI_PIN))
+tft = st7789.ST7789(
+    spi, WIDTH, HEIGHT,
+    reset=Pin(RST_PIN, Pin.OUT),
+    cs=Pin(CS_PIN, Pin.OUT),
+    dc=Pin(DC_PIN, Pin.OUT),
+    backlight=Pin(BACKLIGHT_PIN, Pin.OUT),
+    rotation=0,
+)
+
+
+def _swap_bytes(color):
+    """Convert a 565 color to the byte order the panel expects in a framebuffer"""
+    return ((color & 0xFF) << 8) | (color >> 8)
+
+
+def _decigrams(grams):
+    """Split grams into (sign, whole, tenths) for one-decimal integer formatting"""
+    decigrams = round(grams * 10)
+    if decigrams < 0:
+        decigrams = -decigrams
+        return "-", decigrams // 10, decigrams % 10
+    return "", decigrams // 10, decigrams % 10
+
+
+def _format_mass(grams, formats):
+    """Format a mass in grams with one of the (g, kg) format pairs above"""
+    if grams > 1000:
+        return formats[1] % (grams / 1000)
+    return formats[0] % grams
+
+
+@micropython.viper
+def _blit_glyph(fb: ptr16, font_data: ptr8, start: int, args: ptr32):
+    """
+    Expand one 1-bit glyph straight into the RGB565 framebuffer
+    
+    args holds (pixel offset, fg, bg, glyph width, glyph height, fb width);
+    glyph rows are read MSB first from font_data[start:].
+    """
+    pos = args[0]
+    fg = args[1]
+    bg = args[2]
+    width = args[3]
+    height = args[4]
+    skip = args[5] - width
+    src = start
+    for row in range(height):
+        for col in range(width >> 3):
+            bits = font_data[src]
+            src += 1
+            mask = 0x80
+            while mask:
+                if bits & mask:
+                    fb[pos] = fg
+                else:
+                    fb[pos] = bg
+                pos += 1
+                mask >>= 1
+        pos += skip
+
+
+class DisplayManager:
+    """
+    ST7789 Display Manager for showing AI analysis results and system status
+    
+    Drawing goes into an in-memory framebuffer; the public update/show
+    methods end with flush(), which sends the changed rows to the panel
+    in a single SPI write.
+    """
+    
+    def __init__(self, tft_display):
+        """Initialize display manager"""
+        self.tft = tft_display
+        self.font = font
+        
+        # Framebuffer (RGB565, panel byte order) and dirty row range
+        try:
+            self._fb_data = bytearray(WIDTH * HEIGHT * 2)
+            self._fb_view = memoryview(self._fb_data)
+            self._fb = framebuf.FrameBuffer(self._fb_data, WIDTH, HEIGHT, framebuf.RGB565)
+        except MemoryError:
+            print("WARNING: No RAM for framebuffer - drawing directly to display")
+            self._fb = None
+        self._dirty_top = HEIGHT
+        self._dirty_bottom = 0
+        
+        # DMA channel feeding the SPI TX FIFO so flush() does not block
+        self._dma = None
+        self._dma_busy = False
+        if self._fb is not None and DMA_AVAILABLE:
+            try:
+                self._dma = rp2.DMA()
+                self._dma_ctrl = self._dma.pack_ctrl(
+                    size=0, inc_write=False, treq_sel=SPI_TX_DREQ[SPI_NUM]
+                )
+            except Exception as e:
+                print(f"WARNING: DMA unavailable ({e}) - using blocking display writes")
+                self._dma = None
+        
+        # Glyph size and reusable argument block for _blit_glyph
+        self._glyph_size = font.WIDTH * font.HEIGHT // 8
+        self._glyph_args = array.array('i', [0, 0, 0, font.WIDTH, font.HEIGHT, WIDTH])
+        
+        # Redesigned display areas layout (240x240 pixels)
+        self.header_area = (0, 0, 240, 30)      # System title (smaller)
+        self.weight_area = (0, 35, 240, 65)     # Weight display
+        self.carbon_area = (0, 70, 240, 100)    # Carbon footprint (moved up)
+        self.food_area = (0, 105, 240, 135)     # Food name
+        self.confidence_area = (0, 140, 240, 165) # AI confidence
+        self.impact_area = (0, 170, 240, 195)   # Environmental impact
+        self.status_area = (0, 200, 240, 230)   # System status
+        self.footer_area = (0, 230, 240, 240)   # Time/info
+        
+        # Live weight screen areas (redrawn only when their text changes)
+        self.live_weight_area = (0, 60, 240, 32)
+        self.live_status_area = (0, 100, 240, 32)
+        self._live_areas = (self.live_weight_area, self.live_status_area)
+        
+        # Colors
+        self.BLACK = st7789.BLACK
+        self.WHITE = st7789.WHITE
+        self.RED = st7789.RED
+        self.GREEN = st7789.GREEN
+        self.BLUE = st7789.BLUE
+        self.YELLOW = st7789.YELLOW
+        self.CYAN = st7789.CYAN
+        self.MAGENTA = st7789.MAGENTA
+        self.ORANGE = st7789.color565(255, 165, 0)
+        
+        # Impact level -> color, and (upper limit, color) steps for CO2 grams
+        self._impact_colors = {
+            "LOW": self.GREEN,
+            "MEDIUM": self.YELLOW,
+            "HIGH": self.ORANGE,
+            "VERY_HIGH": self.RED,
+        }
+        self._impact_texts = {level: "Impact: " + level for level in self._impact_colors}
+        self._carbon_color_steps = (
+            (100, self.GREEN),
+            (500, self.YELLOW),
+            (1000, self.ORANGE),
+        )
+        
+        # Stability -> (weight color, status text) for the live weight screen
+        self._stability_styles = {
+            True: (self.GREEN, "STABLE - Ready for Analysis"),
+            False: (self.YELLOW, "MEASURING..."),
+        }
+        
+        # Current display state
+        self.current_weight = 0.0
+        # Last (rounded value, text) per format pair, see _format_cached
+        self._text_cache = {}
+        self.current_food = ""
+        self.current_carbon = 0.0
+        self.current_status = "Initializing..."
+        self.ai_result_received = False
+        
+        # Last (text, color, bg) drawn in each area, used to skip unchanged
+        # redraws
+        self._area_state = {}
+        self._live_screen_drawn = False
+        
+        # Reading shown on the live weight screen; None while it is not shown
+        self.last_drawn_weight = 0.0
+        self.last_drawn_stable = None
+        
+        # Initialize display
+        self.init_display()
+    
+    def init_display(self):
+        """Initialize display with simple welcome screen"""
+        print("Initializing ST7789 Display...")
+        
+        # Clear screen
+        self._fill_rect(0, 0, WIDTH, HEIGHT, self.BLACK)
+        
+        # Simple startup screen with centered text
+        self.draw_text_centered("Carbon Emission", 40, self.WHITE)
+        self.draw_text_centered("Detection", 70, self.WHITE)
+        self.draw_text_centered("System", 110, self.CYAN)
+        self.draw_text_centered("Starting...", 140, self.YELLOW)
+        self.draw_text_centered("Place food on", 170, self.GREEN)
+        self.draw_text_centered("scale to start", 200, self.GREEN)
+        self.flush()
+        
+        print("Display initialized successfully")
+    
+    def _mark_dirty(self, y, h):
+        """Extend the row range that the next flush() must send"""
+        self._dirty_top = max(0, min(self._dirty_top, y))
+        self._dirty_bottom = min(HEIGHT, max(self._dirty_bottom, y + h))
+    
+    def _wait_dma(self):
+        """Wait for a pending DMA flush to leave the SPI bus, then release CS"""
+        if not self._dma_busy:
+            return
+        dma = self._dma
+        while dma.active():
+            pass
+        base = SPI_BASE[SPI_NUM]
+        while mem32[base + SPI_SR] & 0x10:
+            pass
+        # Discard what the TX-only transfer clocked into the RX FIFO
+        while mem32[base + SPI_SR] & 0x04:
+            mem32[base + SPI_DR]
+        mem32[base + SPI_ICR] = 1
+        if self.tft.cs:
+            self.tft.cs.on()
+        self._dma_busy = False
+    
+    def _fill_rect(self, x, y, w, h, color):
+        """Fill a rectangle in the framebuffer"""
+        if self._fb is None:
+            self.tft.fill_rect(x, y, w, h, color)
+            return
+        if self._dma_busy:
+            self._wait_dma()
+        self._fb.fill_rect(x, y, w, h, _swap_bytes(color))
+        self._mark_dirty(y, h)
+    
+    def _draw_text(self, text, x, y, color, bg_color):
+        """Render text into the framebuffer using the bitmap font"""
+        if self._fb is None:
+            self.tft.text(self.font, text, x, y, color, bg_color)
+            return
+        
+        # Same clipping as the driver: rows that would not fit draw nothing
+        if y < 0 or y + self.font.HEIGHT > HEIGHT:
+            return
+        if self._dma_busy:
+            self._wait_dma()
+        
+        args = self._glyph_args
+        args[1] = _swap_bytes(color)
+        args[2] = _swap_bytes(bg_color)
+        
+        fb_data = self._fb_data
+        size = self._glyph_size
+        font_data = self.font.FONT
+        first = self.font.FIRST
+        last = self.font.LAST
+        char_width = self.font.WIDTH
+        row_start = y * WIDTH
+        
+        for char in text:
+            ch = ord(char)
+            # Skip unknown and partially visible glyphs
+            if first <= ch < last and x + char_width <= WIDTH:
+                args[0] = row_start + x
+                _blit_glyph(fb_data, font_data, (ch - first) * size, args)
+            x += char_width
+        
+        self._mark_dirty(y, self.font.HEIGHT)
+    
+    def flush(self):
+        """
+        Send the changed framebuffer rows to the display in one SPI write
+        
+        With DMA the transfer runs in the background and this returns
+        immediately; the next framebuffer draw waits for it to finish.
+        """
+        if self._fb is None or self._dirty_bottom <= self._dirty_top:
+            return
+        top = self._dirty_top
+        bottom = self._dirty_bottom
+        row_bytes = WIDTH * 2
+        rows = self._fb_view[top * row_bytes:bottom * row_bytes]
+        if self._dma is None:
+            self.tft.blit_buffer(rows, 0, top, WIDTH, bottom - top)
+        else:
+            self._wait_dma()
+            # Window commands go out by CPU; CS stays low for the pixel data
+            self.tft._set_window(0, top, WIDTH - 1, bottom - 1)
+            self.tft.dc.on()
+            self._dma.config(
+                read=rows,
+                write=SPI_BASE[SPI_NUM] + SPI_DR,
+                count=len(rows),
+                ctrl=self._dma_ctrl,
+                trigger=True,
+            )
+            self._dma_busy = True
+        self._dirty_top = HEIGHT
+        self._dirty_bottom = 0
+    
+    def draw_text_centered(self, text, y, color):
+        """Draw text centered horizontally at given y position"""
+        try:
+            # Calculate approximate text width (16 pixels per character for this font)
+            text_width = len(text) * 16
+            x = max(0, (WIDTH - text_width) // 2)
+            self._draw_text(text, x, y, color, self.BLACK)
+            self.invalidate_areas()
+        except Exception as e:
+            print(f"Text draw error: {e}")
+    
+    def invalidate_areas(self):
+        """Forget tracked area contents after drawing outside draw_text_area"""
+        self._area_state.clear()
+        self._live_screen_drawn = False
+        self.last_drawn_stable = None
+    
+    def draw_text_area(self, text, area, color, bg_color=None):
+        """Draw text in specified area with background"""
+        try:
+            previous = self._area_state.get(area)
+            if previous == (text, color, bg_color):
+                return
+            
+            x, y, w, h = area
+            
+            # Center text in area (glyphs past the area edge are clipped)
+            text_width = min(len(text) * 16, w)
+            text_x = x + (w - text_width) // 2
+            text_y = y + (h - 32) // 2  # Font height is 32
+            
+            if bg_color is not None:
+                self._fill_rect(x, y, w, h, bg_color)
+            
+            self._draw_text(text, text_x, text_y, color, bg_color or self.BLACK)
+            self._area_state[area] = (text, color, bg_color)
+            if area not in self._live_areas:
+                self._live_screen_drawn = False
+                self.last_drawn_stable = None
+            
+        except Exception as e:
+            print(f"❌ Text draw error: {e}")
+            import traceback
+            traceback.print_exc()
+    
+    def draw_static_background(self):
+        """Draw the fixed parts of the live weight screen once"""
+        self._fill_rect(0, 0, WIDTH, HEIGHT, self.BLACK)
+        
+        # Show instruction for carbon footprint area
+        self.draw_text_centered("Waiting for AI Analysis", 140, self.CYAN)
+        self.draw_text_centered("Carbon footprint will", 170, self.WHITE)
+        self.draw_text_centered("appear here", 190, self.WHITE)
+        
+        self._live_screen_drawn = True
+    
+    def _format_cached(self, grams, formats):
+        """
+        Format a mass, reusing the previous string for these formats while
+        the value rounds to the same 0.1 g
+        """
+        key = round(grams * 10)
+        cached = self._text_cache.get(formats)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = _format_mass(grams, formats)
+        self._text_cache[formats] = (key, text)
+        return text
+    
+    def update_weight(self, weight, is_stable=False):
+        """Update weight display - only redraws areas whose text changed"""
+        self.current_weight = weight
+        
+        if not self._live_screen_drawn:
+            self.draw_static_background()
+        
+        color, status_text = self._stability_styles[bool(is_stable)]
+        
+        # Format weight text (reused while the reading rounds the same)
+        weight_text = self._format_cached(weight, WEIGHT_FORMATS)
+        
+        # Display weight prominently, then status
+        self.draw_text_area(weight_text, self.live_weight_area, color, self.BLACK)
+        self.draw_text_area(status_text, self.live_status_area, color, self.BLACK)
+        self.flush()
+        
+        self.last_drawn_weight = weight
+        self.last_drawn_stable = bool(is_stable)
+    
+    def update_carbon_display(self):
+        """Update carbon footprint display in dedicated area"""
+        if self.current_carbon <= 0:
+            return
+            
+        # Format carbon text
+        carbon_text = self._format_cached(self.current_carbon, CO2_FORMATS)
+        
+        # Choose color based on carbon amount
+        color = self.RED
+        carbon = self.current_carbon
+        for limit, step_color in self._carbon_color_steps:
+            if carbon < limit:
+                color = step_color
+                break
+        
+        # Update carbon display
+        self.draw_text_area(carbon_text, self.carbon_area, color, self.BLACK)
+        self.flush()
+    
+    def update_food_info(self, food_name, confidence=0.0):
+        """Update food information display"""
+        self.current_food = food_name
+        
+        # Choose color based on confidence
+        if confidence > 0.8:
+            color = self.GREEN
+        elif confidence > 0.5:
+            color = self.YELLOW
+        else:
+            color = self.RED
+        
+        # Truncate long food names to fit display
+        display_name = food_name[:14] if len(food_name) > 14 else food_name
+        
+        self.draw_text_area(display_name, self.food_area, color, self.BLACK)
+        
+        # Show confidence if available
+        if confidence > 0:
+            conf_text = f"({confidence*100:.0f}%)"
+            self._draw_text(conf_text, 10, 110, self.WHITE, self.BLACK)
+            self.invalidate_areas()
+        
+        self.flush()
+    
+    def update_carbon_footprint(self, carbon_value, unit="g CO2"):
+        """Update carbon footprint display"""
+        self.current_carbon = carbon_value
+        
+        # Format carbon value
+        carbon_text = self._format_cached(carbon_value, CO2_FORMATS)
+        
+        # Use red color for high emissions, green for low
+        color = self.RED if carbon_value > 100 else self.GREEN if carbon_value < 50 else self.YELLOW
+        
+        self.draw_text_area(carbon_text, self.carbon_area, color, self.BLACK)
+        self.flush()
+    
+    def update_status(self, status, color=None):
+        """Update system status display"""
+        self.current_status = status
+        display_color = color or self.WHITE
+        
+        # Truncate long status messages
+        display_status = status[:18] if len(status) > 18 else status
+        
+        self.draw_text_area(display_status, self.status_area, display_color, self.BLACK)
+        self.flush()
+    
+    def show_ai_analysis(self, food_name, confidence, carbon_footprint):
+        """Display complete AI analysis result"""
+        print(f"Displaying AI result: {food_name}, confidence: {confidence}, carbon: {carbon_footprint}")
+        
+        # Clear previous AI result area
+        self._fill_rect(0, 90, 240, 85, self.BLACK)
+        
+        # Update food name
+        self.update_food_info(food_name, confidence)
+        
+        # Update carbon footprint
+        self.update_carbon_footprint(carbon_footprint)
+        
+        # Update status
+        self.update_status("AI Analysis Complete", self.GREEN)
+        
+        self.ai_result_received = True
+    
+    def display_analysis_result(self, food_name, confidence, weight, co2_grams, impact_level):
+        """Display complete AI analysis result - simple and clear"""
+        sys.stdout.write(ANALYSIS_START_LOG % (food_name, confidence, weight, co2_grams, impact_level))
+        
+        # Store current state first
+        self.current_food = food_name
+        self.current_carbon = co2_grams
+        self.current_weight = weight
+        self.ai_result_received = True
+        
+        # Clear screen completely
+        self._fill_rect(0, 0, WIDTH, HEIGHT, self.BLACK)
+        
+        # Display weight at top
+        weight_text = self._format_cached(weight, WEIGHT_FORMATS)
+        self.draw_text_centered(weight_text, 30, self.GREEN)
+        
+        # Display AI prediction prominently 
+        prediction_text = f"AI: {food_name[:8]}"
+        self.draw_text_centered(prediction_text, 80, self.CYAN)
+        
+        # Display carbon footprint prominently in center
+        carbon_text = self._format_cached(co2_grams, CO2_LABEL_FORMATS)
+        
+        # Color based on impact (unknown levels show as VERY_HIGH)
+        co2_color = self._impact_colors.get(impact_level, self.RED)
+        
+        # Display carbon prominently in center
+        self.draw_text_centered(carbon_text, 130, co2_color)
+        
+        # Display impact level at bottom
+        impact_text = self._impact_texts.get(impact_level) or "Impact: " + impact_level
+        self.draw_text_centered(impact_text, 170, co2_color)
+        self.flush()
+        
+        sys.stdout.write(ANALYSIS_DONE_LOG % carbon_text)
+    
+    def draw_text_left(self, text, x, y, color):
+        """Draw text at specified position"""
+        try:
+            self._draw_text(text, x, y, color, self.BLACK)
+            self.invalidate_areas()
+            self.flush()
+        except Exception as e:
+            print(f"Text draw error: {e}")
+    
+    def show_waiting_for_ai(self):
+        """Show waiting for AI analysis message"""
+        self.update_status("Waiting for AI...", self.CYAN)
+        self._fill_rect(0, 90, 240, 85, self.BLACK)  # Clear food/carbon area
+        self.draw_text_centered("Analyzing food...", 110, self.CYAN)
+        self.flush()
+    
+    def show_system_ready(self):
+        """Show system ready message"""
+        self._fill_rect(0, 0, WIDTH, HEIGHT, self.BLACK)
+        self.draw_text_centered("System Ready", 60, self.GREEN)
+        self.draw_text_centered("Place food on", 100, self.WHITE)
+        self.draw_text_centered("scale for analysis", 120, self.WHITE)
+        self.update_status("Ready", self.GREEN)
+    
+    def show_error(self, error_msg):
+        """Show error message"""
+        self.update_status(f"ERROR: {error_msg}", self.RED)
+    
+    def refresh_display(self):
+        """Refresh the entire display with current values"""
+        try:
+            # Header
+            self.draw_text_centered("Carbon Detection", 5, self.WHITE)
+            
+            # Current values
+            self.update_weight(self.current_weight)
+            if self.current_food:
+                self.update_food_info(self.current_food)
+            if self.current_carbon > 0:
+                self.update_carbon_footprint(self.current_carbon)
+            self.update_status(self.current_status)
+            self.flush()
+            
+        except Exception as e:
+            print(f"Display refresh error: {e}")
+
+
+class ResultReceiver:
+    """Receive and parse AI analysis results from PC"""
+    
+    def __init__(self, display_manager):
+        self.display = display_manager
+        self.buffer = ""
+        
+        # Preallocated line buffer, filled one byte at a time from stdin
+        self._line = bytearray(SERIAL_LINE_MAX)
+        self._line_len = 0
+        self._byte = bytearray(1)
+        self._stdin = getattr(sys.stdin, "buffer", sys.stdin)
+        
+        # Parsed AI_RESULT fields by message text, and the message on screen
+        self._results = {}
+        self._shown = None
+        
+        # Register stdin once; ipoll() reports readiness without allocating
+        try:
+            import select
+            poller = select.poll()
+            poller.register(sys.stdin, select.POLLIN)
+            self._ipoll = getattr(poller, "ipoll", poller.poll)
+        except Exception as e:
+            print(f"WARNING: Serial input polling unavailable ({e})")
+            self._ipoll = None
+    
+    def _input_ready(self, timeout_ms=0):
+        """Return True if stdin has a byte waiting, waiting up to timeout_ms"""
+        for _ in self._ipoll(timeout_ms):
+            return True
+        return False
+    
+    def serve(self, period_ms):
+        """Handle PC input as it arrives for period_ms, then return"""
+        if self._ipoll is None:
+            time.sleep_ms(period_ms)
+            return
+        deadline = time.ticks_add(time.ticks_ms(), period_ms)
+        remaining = period_ms
+        while True:
+            # Always look once, so a zero period still picks up waiting input
+            if self._input_ready(remaining):
+                self.poll_input()
+            remaining = time.ticks_diff(deadline, time.ticks_ms())
+            if remaining <= 0:
+                return
+    
+    def poll_input(self):
+        """Read all waiting bytes from stdin and process each complete line"""
+        if self._ipoll is None:
+            return
+        line = self._line
+        byte = self._byte
+        readinto = self._stdin.readinto
+        
+        while self._input_ready():
+            if not readinto(byte):
+                return
+            ch = byte[0]
+            if ch == 10:  # '\n' ends the message
+                length = self._line_len
+                self._line_len = 0
+                if length:
+                    self.process_serial_input(line[:length].decode())
+            elif ch != 13 and self._line_len < SERIAL_LINE_MAX:
+                line[self._line_len] = ch
+                self._line_len += 1
+        
+    def process_serial_input(self, line):
+        """Process incoming serial data from PC"""
+        try:
+            line = line.strip()
+            
+            # Parse AI result message: AI_RESULT:food:confidence:weight:co2:impact
+            if line.startswith(AI_RESULT_PREFIX):
+                display = self.display
+                write = sys.stdout.write
+                
+                # Log lines for one message go out in a single write
+                # A resend of the result already on screen needs no redraw
+                if line == self._shown and display.ai_result_received:
+                    write(AI_RESULT_REPEAT_LOG % line)
+                    return True
+                
+                result = self._results.get(line)
+                if result is None:
+                    # Locate the field separators with find() rather than
+                    # split(), so no list of substrings is built
+                    find = line.find
+                    start = AI_RESULT_FIELDS
+                    end_food = find(":", start)
+                    end_conf = find(":", end_food + 1)
+                    end_weight = find(":", end_conf + 1)
+                    end_co2 = find(":", end_weight + 1)
+                    if end_food > 0 and end_conf > 0 and end_weight > 0 and end_co2 > 0:
+                        end_impact = find(":", end_co2 + 1)
+                        if end_impact < 0:
+                            end_impact = len(line)
+                        # Convert to appropriate types
+                        result = (
+                            line[start:end_food],
+                            float(line[end_food + 1:end_conf]),  # Keep as float to handle decimals
+                            float(line[end_conf + 1:end_weight]),
+                            float(line[end_weight + 1:end_co2]),
+                            line[end_co2 + 1:end_impact],
+                        )
+                        if len(self._results) >= RESULT_CACHE_SIZE:
+                            self._results.clear()
+                        self._results[line] = result
+                
+                if result is not None:
+                    food_name, confidence, weight, co2_grams, impact_level = result
+                    
+                    write(AI_RESULT_LOG % (line, food_name, confidence, weight, co2_grams))
+                    
+                    # Set flag to stop weight updates and display AI result
+                    display.ai_result_received = True
+                    
+                    # Display on screen
+                    display.display_analysis_result(
+                        food_name, confidence, weight, co2_grams, impact_level
+                    )
+                    self._shown = line
+                    
+                    return True
+                else:
+                    write(AI_RESULT_INVALID_LOG % (line, line.count(":") + 1))
+            else:
+                print(f"📨 Received: {line}")
+            
+            return False
+            
+        except Exception as e:
+            print(f"❌ Error processing serial input: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+
+@micropython.viper
+def _sample_stats(samples: ptr32, n: int, stats: ptr32):
+    """
+    Store (min, max, median) of n raw samples in stats
+    
+    Five samples (the default RAPID_SAMPLE_COUNT) use a fixed 7-step
+    compare-exchange network; other counts fall back to an in-place
+    insertion sort.
+    """
+    low = samples[0]
+    high = low
+    for i in range(1, n):
+        value = samples[i]
+        if value < low:
+            low = value
+        if value > high:
+            high = value
+    stats[0] = low
+    stats[1] = high
+    
+    if n == 5:
+        a = samples[0]
+        b = samples[1]
+        c = samples[2]
+        d = samples[3]
+        e = samples[4]
+        if a > b:
+            t = a
+            a = b
+            b = t
+        if d > e:
+            t = d
+            d = e
+            e = t
+        if a > d:
+            d = a
+        if b > e:
+            b = e
+        if b > c:
+            t = b
+            b = c
+            c = t
+        if c > d:
+            c = d
+        if b > c:
+            c = b
+        stats[2] = c
+        return
+    
+    for i in range(1, n):
+        value = samples[i]
+        j = i - 1
+        while j >= 0 and samples[j] > value:
+            samples[j + 1] = samples[j]
+            j -= 1
+        samples[j + 1] = value
+    stats[2] = samples[n // 2]
+
+
+class WeightSensor:
+    """
+    Simplified HX711 weight sensor interface with simulation fallback
+    """
+    
+    def __init__(self, data_pin=PIN_DATA, clock_pin=PIN_CLOCK):
+        """Initialize the weight sensor with retry and fallback"""
+        print("Initializing HX711 Weight Sensor...")
+        
+        self._tare_offset = 0.0
+        self._last_stable_weight = 0.0
+        self._is_initialized = False
+        self._simulation_mode = False
+        self._sim_weight = 0.0
+        
+        # Latest reading, updated in place by get_weight_fast()
+        self.last_weight = 0.0
+        self.last_stable = False
+        
+        # Preallocated raw sample buffer and (min, max, median) results
+        self._samples = array.array('i', [0] * RAPID_SAMPLE_COUNT)
+        self._stats = array.array('i', [0, 0, 0])
+        
+        # Ring of the latest raw readings, filled from PIO or the DOUT interrupt
+        self._ring = array.array('i', [0] * RAPID_SAMPLE_COUNT)
+        self._ring_index = 0
+        self._ring_count = 0
+        self._ring_sampling = False
+        self._sm = None
+        
+        # Sensor health, checked out-of-band by check_health()
+        self._last_sample_ms = time.ticks_ms()
+        self._read_failures = 0
+        
+        # Try to initialize HX711 with retries
+        for attempt in range(3):
+            try:
+                print(f"HX711 initialization attempt {attempt + 1}...")
+                
+                # Configure GPIO pins
+                self._pin_data = Pin(data_pin, Pin.IN, pull=Pin.PULL_DOWN)
+                self._pin_clock = Pin(clock_pin, Pin.OUT)
+                
+                # Initialize HX711 driver
+                self._hx711 = HX711(self._pin_clock, self._pin_data, sm_id=HX711_PIO_SM)
+                
+                # Test reading
+                test_value = self._hx711.get_value()
+                print(f"Test reading: {test_value}")
+                
+                print("HX711 initialization successful!")
+                self._is_initialized = True
+                break
+                
+            except Exception as e:
+                print(f"HX711 init attempt {attempt + 1} failed: {e}")
+                time.sleep(1)
+        
+        # If HX711 failed, use simulation mode
+        if not self._is_initialized:
+            print("WARNING: HX711 initialization failed - using SIMULATION MODE")
+            print("System will generate simulated weight data for testing")
+            self._simulation_mode = True
+            self._is_initialized = True
+    
+    def warmup(self):
+        """Warmup the sensor by performing dummy readings"""
+        if self._simulation_mode:
+            print("Simulation mode - skipping warmup")
+            return
+            
+        print("Warming up sensor...")
+        for _ in range(WARMUP_SAMPLES):
+            try:
+                self._hx711.get_value()
+                time.sleep(0.05)
+            except:
+                break
+        print("Sensor warmup complete")
+    
+    def calibrate_zero(self, samples=20):
+        """Calibrate the zero point (tare) of the scale"""
+        print("Zero Point Calibration")
+        print("Please ensure the scale is empty")
+        
+        if self._simulation_mode:
+            print("Simulation mode - using default zero offset")
+            self._tare_offset = 0.0
+            self._is_initialized = True
+            print("Calibration complete (simulated)")
+            return
+        
+        # A zero saved by an earlier boot is reused while the scale still
+        # reads close to it, skipping the countdown, warmup and tare
+        if self._reuse_saved_zero():
+            return
+        
+        # Countdown
+        for i in range(3, 0, -1):
+            print(f"Starting in {i}...")
+            time.sleep(1)
+        
+        # Warmup before calibration
+        self.warmup()
+        
+        print("Calibrating...")
+        
+        try:
+            # Perform HX711 tare operation
+            self._hx711.tare()
+            
+            # Collect samples for accurate zero point, keeping a running mean
+            tare_samples = array.array('f', [0.0] * samples)
+            mean = 0.0
+            for i in range(samples):
+                reading = self._hx711.get_value()
+                tare_samples[i] = reading
+                mean += (reading - mean) / (i + 1)
+                if i % 5 == 0:
+                    print(f"  Progress: {i}/{samples}")
+                time.sleep(0.05)
+            
+            # Calculate robust average: drop samples far from the mean,
+            # measured in mean absolute deviations
+            deviation = 0.0
+            for reading in tare_samples:
+                deviation += abs(reading - mean)
+            limit = TARE_OUTLIER_K * deviation / samples
+            
+            total = 0.0
+            count = 0
+            for reading in tare_samples:
+                if abs(reading - mean) <= limit:
+                    total += reading
+                    count += 1
+            residual = total / count if count else mean
+            
+            # Fold the residual into the driver offset: one raw zero shared
+            # by polled and background readings, saved for the next boot
+            hx711 = self._hx711
+            hx711.set_offset(hx711.OFFSET + int(residual))
+            hx711.save_calib()
+            self._tare_offset = hx711.OFFSET
+            
+            print(f"Calibration complete - Zero offset: {self._tare_offset:.0f} LSB")
+            
+        except Exception as e:
+            print(f"Calibration error: {e}")
+            print("Using default zero offset")
+            self._tare_offset = self._hx711.OFFSET
+    
+    def _reuse_saved_zero(self):
+        """Adopt the zero offset saved by an earlier boot if it still holds"""
+        hx711 = self._hx711
+        if not hx711.load_calib():
+            return False
+        
+        try:
+            reading = hx711.read_average(TARE_CHECK_SAMPLES)
+        except Exception as e:
+            print(f"Saved zero check failed: {e}")
+            return False
+        
+        drift = abs(reading - hx711.OFFSET) / CALIBRATION_FACTOR
+        if drift > TARE_REUSE_GRAMS:
+            print(f"Saved zero is {drift:.1f}g off - recalibrating")
+            return False
+        
+        self._tare_offset = hx711.OFFSET
+        print(f"Calibration complete - Saved zero offset: {self._tare_offset:.0f} LSB")
+        return True
+    
+    def start_sampling(self):
+        """
+        Switch to background sampling into the ring
+        
+        The driver's PIO state machine keeps clocking the HX711 when
+        available; otherwise a DOUT falling-edge interrupt reads it.
+        Call after warmup and calibration, which read the HX711 directly.
+        """
+        if self._simulation_mode:
+            return
+        
+        self._last_sample_ms = time.ticks_ms()
+        sm = self._hx711.sm
+        if sm is not None:
+            # Leave the driver's state machine running; get_weight_fast
+            # drains its FIFO
+            sm.active(1)
+            self._sm = sm
+            self._ring_sampling = True
+            print("HX711 PIO sampling enabled")
+            return
+        
+        # DOUT may already be low, in which case no edge will arrive: take
+        # that conversion before arming the interrupt. From then on only the
+        # handler reads, so no other read can interleave SCK pulses with
+        # it; an edge missed later is recovered by check_health()
+        self._on_data_ready(self._pin_data)
+        
+        try:
+            self._pin_data.irq(handler=self._on_data_ready, trigger=Pin.IRQ_FALLING)
+            self._ring_sampling = True
+            print("HX711 interrupt-driven sampling enabled")
+        except Exception as e:
+            print(f"IRQ sampling unavailable ({e}) - polling HX711")
+    
+    def stop_sampling(self):
+        """Stop background sampling and release the HX711 pins"""
+        if self._sm is not None:
+            sm = self._sm
+            sm.active(0)
+            while sm.rx_fifo():
+                sm.get()  # Stale readings would confuse the driver's read()
+            self._sm = None
+        elif self._ring_sampling:
+            self._pin_data.irq(handler=None)
+        self._ring_sampling = False
+    
+    def check_health(self):
+        """
+        Reset the HX711 if it has stopped producing readings
+        
+        Runs outside the sampling path, so reads themselves need no
+        per-sample error handling.
+        """
+        if self._simulation_mode:
+            return
+        if self._ring_sampling:
+            if time.ticks_diff(time.ticks_ms(), self._last_sample_ms) < HX711_STALE_MS:
+                return
+            print("WARNING: HX711 stopped responding - resetting")
+        elif self._read_failures:
+            print(f"WARNING: {self._read_failures} HX711 read failures - resetting")
+        else:
+            return
+        
+        resume = self._ring_sampling
+        self.stop_sampling()
+        
+        # Holding SCK high for more than 60 us powers the chip down;
+        # pulling it low again restarts it
+        self._hx711.power_down()
+        time.sleep_ms(1)
+        self._hx711.power_up()
+        
+        self._read_failures = 0
+        self._ring_count = 0
+        if resume:
+            self.start_sampling()
+    
+    def _push_raw(self, raw):
+        """Store one raw reading in the ring"""
+        self._last_sample_ms = time.ticks_ms()
+        index = self._ring_index
+        self._ring[index] = raw
+        index += 1
+        self._ring_index = 0 if index >= RAPID_SAMPLE_COUNT else index
+        if self._ring_count < RAPID_SAMPLE_COUNT:
+            self._ring_count += 1
+    
+    def _on_data_ready(self, pin):
+        """DOUT went low: clock out the new conversion into the ring"""
+        if pin.value():
+            return  # Edge from the data bits of a read already done
+        self._push_raw(self._hx711.read())
+    
+    def get_raw_value(self):
+        """Get raw ADC value from HX711 (errors propagate to the caller)"""
+        if self._simulation_mode:
+            # Return simulated raw value
+            return int(self._sim_weight * CALIBRATION_FACTOR + self._tare_offset)
+        return self._hx711.read()
+    
+    def get_weight_fast(self):
+        """
+        Get weight measurement with fast stabilization algorithm
+        
+        Stores the result in last_weight (grams) and last_stable (bool)
+        instead of returning a tuple, so a reading allocates no tuple.
+        """
+        if not self._is_initialized:
+            print("ERROR: Sensor not calibrated")
+            self.last_weight = 0.0
+            self.last_stable = False
+            return
+        
+        if self._simulation_mode:
+            # Simulate weight changes for testing
+            try:
+                cycle_time = (time.ticks_ms() // 1000) % 30  # 30-second cycle
+                
+                if cycle_time < 10:
+                    self._sim_weight = 0.0  # Empty scale
+                elif cycle_time < 20:
+                    self._sim_weight = 125.0 + (cycle_time % 3) * 2  # Stable weight with small variation
+                else:
+                    self._sim_weight = 80.0 + cycle_time  # Changing weight
+                
+                # Simulate stability based on weight change
+                weight_change = abs(self._sim_weight - self._last_stable_weight)
+                is_stable = weight_change < STABILITY_THRESHOLD and self._sim_weight > MIN_WEIGHT_THRESHOLD
+                
+                if is_stable:
+                    self._last_stable_weight = self._sim_weight
+                
+                self.last_weight = self._sim_weight
+                self.last_stable = is_stable
+                return
+            except Exception as e:
+                print(f"Simulation error: {e}")
+                self.last_weight = 0.0
+                self.last_stable = False
+                return
+        
+        # Real sensor measurement
+        samples = self._samples
+        stats = self._stats
+        median_weight = 0.0
+        is_stable = False
+        sample_range = 0.0
+        weight_change = 0.0
+        
+        try:
+            if self._ring_sampling:
+                if self._sm is not None:
+                    # Drain conversions clocked out by the PIO program,
+                    # decoded by the driver exactly as its own reads are
+                    read_pending = self._hx711.read_pending
+                    raw = read_pending()
+                    while raw is not None:
+                        self._push_raw(raw)
+                        raw = read_pending()
+                if self._ring_count < RAPID_SAMPLE_COUNT:
+                    self.last_weight = 0.0
+                    self.last_stable = False
+                    return  # Still filling the ring
+                
+                # Latest background readings; no waiting on DOUT
+                ring = self._ring
+                for i in range(RAPID_SAMPLE_COUNT):
+                    samples[i] = ring[i]
+            else:
+                # Collect rapid raw samples; a failed read aborts the whole
+                # measurement and is handled by check_health()
+                get_raw_value = self.get_raw_value
+                sleep = time.sleep
+                for i in range(RAPID_SAMPLE_COUNT):
+                    samples[i] = get_raw_value()
+                    sleep(RAPID_SAMPLE_INTERVAL)
+            
+            # Range and median on raw LSB values, converted to grams once
+            _sample_stats(samples, RAPID_SAMPLE_COUNT, stats)
+            sample_range = (stats[1] - stats[0]) / CALIBRATION_FACTOR
+            median_weight = (stats[2] - self._tare_offset) / CALIBRATION_FACTOR
+            
+            # If readings are highly variable, weight is changing
+            if sample_range > 50.0:  # Large variation threshold
+                self.last_weight = median_weight
+                self.last_stable = False
+                return
+            
+            # Check stability against last stable reading
+            try:
+                weight_change = abs(median_weight - self._last_stable_weight)
+                is_stable = weight_change < STABILITY_THRESHOLD
+            except:
+                is_stable = False
+            
+            # Update stable weight if significant change detected
+            try:
+                if not is_stable and sample_range < 10.0:  # New stable weight
+                    self._last_stable_weight = median_weight
+            except:
+                pass
+            
+            # Return appropriate weight
+            try:
+                if is_stable:
+                    self.last_weight = self._last_stable_weight
+                    self.last_stable = True
+                    return
+                else:
+                    self.last_weight = median_weight
+                    self.last_stable = False
+                    return
+            except:
+                self.last_weight = 0.0
+                self.last_stable = False
+                return
+            
+        except Exception as e:
+            print(f"Weight reading error: {e}")
+            self._read_failures += 1
+            self.last_weight = 0.0
+            self.last_stable = False
+            return
+
+
+class SimpleWeightSystem:
+    """
+    Main system controller - simplified version
+    """
+    
+    def __init__(self):
+        """Initialize the simplified system"""
+        print("=== Simple Food Weight Detection System ===")
+        print("Hardware Module - Raspberry Pi Pico + ST7789")
+        print("Weight sensing + AI analysis display")
+        print()
+        
+        # Initialize display manager
+        self.display = DisplayManager(tft)
+        
+        # Initialize weight sensor
+        self.weight_sensor = WeightSensor()
+        
+        # Initialize result receiver
+        self.result_receiver = ResultReceiver(self.display)
+        
+        # System state for weight monitoring
+        self.last_sent_weight = 0.0
+        self.last_sent_time = None  # time.ticks_ms() of the last send
+        
+        # AI analysis state
+        self.current_ai_result = None
+        self.waiting_for_ai = False
+        
+        # Start from a clean heap and let automatic collections trigger
+        # early, so any that happen between scheduled ones stay short
+        gc.collect()
+        gc.threshold(gc.mem_free() // 4)
+        
+        print("System initialization complete")
+    
+    def collect_garbage(self):
+        """Run a collection at a point where a pause is harmless"""
+        if GC_DEBUG:
+            before = gc.mem_alloc()
+            gc.collect()
+            print(f"MSG:GC:{before}->{gc.mem_alloc()}")
+        else:
+            gc.collect()
+    
+    def initialize(self):
+        """Initialize and calibrate the system"""
+        try:
+            # Calibrate weight sensor, then let the DOUT interrupt take over
+            self.weight_sensor.calibrate_zero()
+            self.weight_sensor.start_sampling()
+            
+            print("System ready for operation")
+            print("Starting autonomous weight monitoring...")
+            
+        except Exception as e:
+            print(f"Initialization error: {e}")
+    
+    def send_weight_message(self, weight, is_stable):
+        """Send weight data using simple text protocol"""
+        try:
+            # Format: WEIGHT:123.5:STABLE or WEIGHT:123.5:CHANGING
+            # Send via USB serial as a single write
+            sys.stdout.write(WEIGHT_FRAMES[bool(is_stable)] % _decigrams(weight))
+            
+            return True
+            
+        except Exception as e:
+            print(f"Send error: {e}")
+            return False
+    
+    def send_status_message(self):
+        """Send system status message"""
+        try:
+            self.weight_sensor.get_weight_fast()
+            current_weight = self.weight_sensor.last_weight
+            mode = "SIMULATION" if self.weight_sensor._simulation_mode else "REAL"
+            message = f"STATUS:READY:MODE:{mode}:WEIGHT:{current_weight:.1f}"
+            print(message)
+        except Exception as e:
+            print(f"Status error: {e}")
+    
+    def check_pc_input(self, period_ms=0):
+        """Handle incoming data from PC, waiting for it up to period_ms"""
+        try:
+            self.result_receiver.serve(period_ms)
+        except Exception as e:
+            # Silent fail for input checking
+            pass
+    
+    def run(self):
+        """Main system loop - continuous weight monitoring"""
+        print("Starting autonomous weight monitoring system...")
+        print("Weight will be sent automatically when detected!")
+        print()
+        
+        # Weight monitoring state: the last SETTLE_WINDOW readings in 0.1 g
+        # units; a weight is sent once when their spread drops below
+        # SETTLE_RANGE
+        history = array.array('i', [0] * SETTLE_WINDOW)
+        history_index = 0
+        history_mask = SETTLE_WINDOW - 1
+        settle_range = int(SETTLE_RANGE * 10)
+        was_settled = False
+        loop_counter = 0
+        loops_since_gc = 0
+        
+        # Send initial status
+        self.send_status_message()
+        
+        # Bind hot-loop lookups to locals once
+        display = self.display
+        update_weight = display.update_weight
+        weight_sensor = self.weight_sensor
+        get_weight = weight_sensor.get_weight_fast
+        check_pc_input = self.check_pc_input
+        check_health = weight_sensor.check_health
+        send = self.send_weight_message
+        collect_garbage = self.collect_garbage
+        mem_free = gc.mem_free
+        sleep = time.sleep
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        ticks_add = time.ticks_add
+        min_weight = MIN_WEIGHT_THRESHOLD
+        redraw_threshold = WEIGHT_REDRAW_THRESHOLD
+        
+        # Readings are due on a fixed LOOP_PERIOD_MS grid, whatever each
+        # iteration's work takes
+        next_tick = ticks_ms()
+        
+        try:
+            while True:
+                loop_counter += 1
+                loops_since_gc += 1
+                
+                # Show loop activity every 500 iterations (about every 100 seconds)
+                if loop_counter % 500 == 0:
+                    print(f"MSG:LOOP:{loop_counter}:MONITORING")
+                
+                # HX711 watchdog, kept out of the sampling path
+                if loop_counter % HEALTH_CHECK_LOOPS == 0:
+                    check_health()
+                
+                try:
+                    # Get current weight
+                    get_weight()
+                    weight = weight_sensor.last_weight
+                    is_stable = weight_sensor.last_stable
+                    current_time = ticks_ms()
+                    
+                    history[history_index] = int(weight * 10)
+                    history_index = (history_index + 1) & history_mask
+                    settled = max(history) - min(history) < settle_range
+                    newly_settled = settled and not was_settled
+                    was_settled = settled
+                    
+                    # Only update display with current weight if no AI result is being displayed
+                    if not display.ai_result_received:
+                        # Redraw only on a visible change or a stability flip
+                        if (is_stable != display.last_drawn_stable or
+                                abs(weight - display.last_drawn_weight) > redraw_threshold):
+                            update_weight(weight, is_stable)
+                    else:
+                        # AI result is being displayed - skip weight updates
+                        if loop_counter % 50 == 0:  # Print every 10 seconds
+                            print(f"🔒 AI result displayed - skipping weight update ({weight:.1f}g)")
+                    
+                    # Check if weight is significant
+                    if weight > min_weight:
+                        # Send once each time the readings settle
+                        if newly_settled:
+                            # Check if this is a new weight worth sending
+                            weight_diff = abs(weight - self.last_sent_weight)
+                            
+                            # Send if weight changed significantly or enough time passed
+                            should_send = (
+                                weight_diff > WEIGHT_CHANGE_THRESHOLD or 
+                                self.last_sent_time is None or 
+                                ticks_diff(current_time, self.last_sent_time) > TIME_BETWEEN_SENDS
+                            )
+                            
+                            if should_send:
+                                success = send(weight, True)
+                                if success:
+                                    self.last_sent_weight = weight
+                                    self.last_sent_time = current_time
+                                    print(SENT_MESSAGE % _decigrams(weight))
+                                    # PC is now busy with AI analysis
+                                    collect_garbage()
+                                    loops_since_gc = 0
+                            
+                        # Show current reading every 50 loops when weight detected
+                        if loop_counter % 50 == 0:
+                            print(CURRENT_MESSAGES[bool(is_stable)] % _decigrams(weight))
+                            
+                    else:
+                        # No significant weight - reset AI result display if weight is very low
+                        if weight < 5.0 and display.ai_result_received:
+                            print("Weight removed - resetting to live weight display")
+                            display.ai_result_received = False
+                            display.current_carbon = 0.0
+                            display.current_food = ""
+                            # Show live weight display again
+                            update_weight(weight, is_stable)
+                    
+                    # Memory management: gc.threshold() schedules routine
+                    # collections; only step in here when the heap runs low
+                    if loops_since_gc >= GC_INTERVAL:
+                        if mem_free() < GC_LOW_MEMORY:
+                            collect_garbage()
+                        loops_since_gc = 0
+                    
+                    # Serve PC data until the next reading is due; AI results
+                    # are handled as soon as they arrive. After an overrun the
+                    # missed slots are dropped rather than run back to back
+                    next_tick = ticks_add(next_tick, LOOP_PERIOD_MS)
+                    delay = ticks_diff(next_tick, ticks_ms())
+                    if delay < 0:
+                        next_tick = ticks_ms()
+                        delay = 0
+                    check_pc_input(delay)
+                    
+                except Exception as e:
+                    print(f"ERROR:WEIGHT_MONITORING:{e}")
+                    sleep(1)
+                
+        except KeyboardInterrupt:
+            print("MSG:SYSTEM:STOPPED_BY_USER")
+        except Exception as e:
+            print(f"ERROR:SYSTEM:{e}")
+
+
+def main():
+    """Main application entry point"""
+    try:
+        # Create and initialize system
+        system = SimpleWeightSystem()
+        system.initialize()
+        
+        # Run main loop
+        system.run()
+        
+    except Exception as e:
+        print(f"ERROR:FATAL:{e}")
+
+
+if __name__ == "__main__":
+    main()
+
+
+
@@ -23,6 +23,10 @@ except ImportError as e:
     print(f"WARNING: AI modules not found ({e}) - will use simulation mode")
     AI_AVAILABLE = False
 
+# Pico wire format: AI_RESULT:food:confidence:weight:co2:impact, one line per
+# result with fixed one-decimal numbers so the frame fits the Pico's line buffer
+AI_RESULT_FORMAT = "AI_RESULT:%s:%.1f:%.1f:%.1f:%s"
+
 
 class MockAI:
     """Simulated AI system for demonstration and testing purposes"""
@@ -1069,7 +1073,10 @@ class FoodCarbonGUI:
             print(f"DEBUG: Extracted data - food:{food_name}, conf:{confidence}, co2:{co2_grams}")
             
             # Format message: AI_RESULT:food:confidence:weight:co2:impact
-            message = f"AI_RESULT:{food_name}:{confidence}:{weight_grams:.1f}:{co2_grams:.1f}:{impact_level}"
+            # ':' is the field separator, so it must not appear inside the name
+            message = AI_RESULT_FORMAT % (
+                str(food_name).replace(':', ' '), confidence, weight_grams, co2_grams, impact_level
+            )
             
             print(f"DEBUG: Formatted message: {message}")
             
@@ -1460,8 +1467,18 @@ class FoodCarbonGUI:
         if self.current_frame is not None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"captured_frame_{timestamp}.jpg"
-            cv2.imwrite(filename, self.current_frame)
-            messagebox.showinfo("Frame Saved", f"📷 Frame saved successfully!\nFilename: {filename}")
+            try:
+                # current_frame is RGB; OpenCV writes BGR
+                frame_bgr = cv2.cvtColor(self.current_frame, cv2.COLOR_RGB2BGR)
+                saved = cv2.imwrite(filename, frame_bgr)
+            except Exception as e:
+                messagebox.showerror("Save Error", f"Failed to save frame:\n{str(e)}")
+                return
+            
+            if saved:
+                messagebox.showinfo("Frame Saved", f"📷 Frame saved successfully!\nFilename: {filename}")
+            else:
+                messagebox.showerror("Save Error", f"Failed to save frame to {filename}")
         else:
             messagebox.showerror("Error", "No camera frame available to save")
     
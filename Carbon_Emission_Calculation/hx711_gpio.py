@@ -1,107 +1,244 @@
-import time
-from machine import Pin
-
-class HX711:
-    def __init__(self, pd_sck, dout, gain=128):
-        self.pSCK = pd_sck
-        self.pDOUT = dout
-        self.pSCK.value(False)
-        self.GAIN = 0
-        self.OFFSET = 0
-        self.SCALE = 1
-        self.time_constant = 0.1
-        self.set_gain(gain)
-
-    def set_gain(self, gain):
-        if gain is 128:
-            self.GAIN = 1
-        elif gain is 64:
-            self.GAIN = 3
-        elif gain is 32:
-            self.GAIN = 2
-
-        self.pSCK.value(False)
-        self.read()
-
-    def is_ready(self):
-        return self.pDOUT.value() == 0
-
-    def read(self):
-        # wait for the device to be ready
-        # for i in range(500):
-        #     if self.pDOUT.value() == 0:
-        #         break
-        #     time.sleep_ms(1)
-        
-        # if self.pDOUT.value() == 1:
-        #     raise OSError("HX711 not ready")
-
-        # count = 0
-        # for i in range(24):
-        #     self.pSCK.value(True)
-        #     self.pSCK.value(False)
-        #     count = count << 1
-        #     if self.pDOUT.value():
-        #         count += 1
-
-        # self.pSCK.value(True)
-        # count = count ^ 0x800000
-        # self.pSCK.value(False)
-
-        # for i in range(self.GAIN):
-        #     self.pSCK.value(True)
-        #     self.pSCK.value(False)
-
-        # return count
-        
-        # Simplified read for stability
-        count = 0
-        while self.pDOUT.value():
-            pass
-
-        for i in range(24):
-            self.pSCK.value(True)
-            count = count << 1
-            self.pSCK.value(False)
-            if self.pDOUT.value():
-                count += 1
-
-        self.pSCK.value(True)
-        count = count ^ 0x800000
-        self.pSCK.value(False)
-
-        for i in range(self.GAIN):
-            self.pSCK.value(True)
-            self.pSCK.value(False)
-
-        return count
-
-    def read_average(self, times=3):
-        sum = 0
-        for i in range(times):
-            sum += self.read()
-        return sum / times
-
-    def get_value(self):
-        return self.read_average(1) - self.OFFSET
-
-    def get_units(self):
-        return self.get_value() / self.SCALE
-
-    def tare(self, times=15):
-        sum = self.read_average(times)
-        self.set_offset(sum)
-
-    def set_scale(self, scale):
-        self.SCALE = scale
-
-    def set_offset(self, offset):
-        self.OFFSET = offset
-
-    def power_down(self):
-        self.pSCK.value(False)
-        self.pSCK.value(True)
-
-    def power_up(self):
-        self.pSCK.value(False)
-
+import time
+import struct
+import micropython
+from machine import Pin
+
+# On RP2040 a PIO state machine clocks the chip with exact timing
+try:
+    import rp2
+except ImportError:
+    rp2 = None
+
+PIO_FREQ = 1000000  # 1 us per PIO instruction
+READY_TIMEOUT_MS = 500  # A conversion takes 100 ms at 10 SPS; longer means no chip
+EMA_SHIFT = 3  # get_value() smoothing: each new reading weighs 1/8
+
+CALIB_FILE = "/calib.bin"  # OFFSET and SCALE saved by save_calib()
+CALIB_FORMAT = "<if"
+
+# Gain -> SCK pulses sent after the 24 data bits and the extra pulse that
+# always follows them, as in the original driver (CALIBRATION_FACTOR was
+# measured with this sequence)
+_GAIN_PULSES = {128: 1, 64: 3, 32: 2}
+
+if rp2 is not None:
+    @rp2.asm_pio(set_init=rp2.PIO.OUT_LOW, in_shiftdir=rp2.PIO.SHIFT_LEFT)
+    def hx711_pio():
+        # Y holds the number of gain pulses (see set_gain); the loop runs
+        # Y + 1 times, the first being the extra pulse after the data bits
+        wait(0, pin, 0)
+        set(x, 23)
+        label("bit")
+        set(pins, 1)    [3]
+        in_(pins, 1)
+        set(pins, 0)    [3]
+        jmp(x_dec, "bit")
+        mov(x, y)
+        label("gain")
+        set(pins, 1)    [3]
+        set(pins, 0)    [3]
+        jmp(x_dec, "gain")
+        push()
+
+@micropython.native
+def _shift_in(sck, dout, pulses):
+    # Bit-banged fallback of hx711_pio: 24 data bits MSB first, the extra
+    # pulse, then the gain pulses selecting the next conversion; compiled
+    # to native code
+    sck_value = sck.value
+    dout_value = dout.value
+    count = 0
+    for _ in range(24):
+        sck_value(1)
+        count <<= 1
+        sck_value(0)
+        if dout_value():
+            count += 1
+    sck_value(1)
+    sck_value(0)
+    for _ in range(pulses):
+        sck_value(1)
+        sck_value(0)
+    return count ^ 0x800000
+
+class HX711:
+    def __init__(self, pd_sck, dout, gain=128, sm_id=0):
+        self.pSCK = pd_sck
+        self.pDOUT = dout
+        self.pSCK.value(False)
+        self.GAIN = 0
+        self.OFFSET = 0
+        self.SCALE = 1
+        self.time_constant = 0.1
+        self._ema = None  # Smoothed reading in 1/2**EMA_SHIFT LSB units
+        self.sm_id = sm_id
+        self.sm = None
+        self.init_sm()
+        self.set_gain(gain)
+
+    def init_sm(self):
+        # Hand SCK to a PIO state machine; read() falls back to
+        # bit-banging when PIO is unavailable
+        if rp2 is None:
+            return
+        try:
+            self.sm = rp2.StateMachine(
+                self.sm_id, hx711_pio, freq=PIO_FREQ,
+                set_base=self.pSCK, in_base=self.pDOUT,
+            )
+        except Exception:
+            self.sm = None
+            return
+        if self.GAIN:
+            self.load_gain()
+
+    def load_gain(self):
+        self.sm.put(self.GAIN)
+        self.sm.exec("pull()")
+        self.sm.exec("mov(y, osr)")
+
+    def set_gain(self, gain):
+        # Unsupported values fall back to the gain 128 setting
+        self.GAIN = _GAIN_PULSES.get(gain, 1)
+
+        if self.sm is not None:
+            self.load_gain()
+        else:
+            self.pSCK.value(False)
+        self.read()
+
+    def is_ready(self):
+        return self.pDOUT.value() == 0
+
+    def _wait(self, ready):
+        # Sleep between checks so other work runs during the conversion,
+        # and give up on a missing or stuck chip instead of hanging
+        if ready():
+            return
+        deadline = time.ticks_add(time.ticks_ms(), READY_TIMEOUT_MS)
+        while not ready():
+            if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                raise OSError("HX711 not ready")
+            time.sleep_ms(1)
+
+    def read(self):
+        if self.sm is not None:
+            # The program waits for DOUT low, clocks the bits and pushes
+            # them; idle the state machine between reads
+            sm = self.sm
+            sm.active(1)
+            try:
+                self._wait(sm.rx_fifo)
+            finally:
+                sm.active(0)
+            return sm.get() ^ 0x800000
+
+        # wait for the device to be ready
+        # for i in range(500):
+        #     if self.pDOUT.value() == 0:
+        #         break
+        #     time.sleep_ms(1)
+        
+        # if self.pDOUT.value() == 1:
+        #     raise OSError("HX711 not ready")
+
+        # count = 0
+        # for i in range(24):
+        #     self.pSCK.value(True)
+        #     self.pSCK.value(False)
+        #     count = count << 1
+        #     if self.pDOUT.value():
+        #         count += 1
+
+        # self.pSCK.value(True)
+        # count = count ^ 0x800000
+        # self.pSCK.value(False)
+
+        # for i in range(self.GAIN):
+        #     self.pSCK.value(True)
+        #     self.pSCK.value(False)
+
+        # return count
+        
+        # Simplified read for stability
+        self._wait(self.is_ready)
+        return _shift_in(self.pSCK, self.pDOUT, self.GAIN)
+
+    def read_pending(self):
+        # Next conversion a free-running state machine has already pushed,
+        # or None; clocked with the same 24 + 1 + GAIN pulses as read()
+        sm = self.sm
+        if sm is None or not sm.rx_fifo():
+            return None
+        return sm.get() ^ 0x800000
+
+    def read_average(self, times=3):
+        # Integer average: no float allocation per reading
+        if times == 1:
+            return self.read()
+        sum = 0
+        for i in range(times):
+            sum += self.read()
+        return sum // times
+
+    def get_value(self):
+        # One conversion per call, smoothed by an integer exponential
+        # moving average instead of waiting for several conversions
+        raw = self.read()
+        ema = self._ema
+        if ema is None:
+            ema = raw << EMA_SHIFT
+        else:
+            ema += raw - (ema >> EMA_SHIFT)
+        self._ema = ema
+        return (ema >> EMA_SHIFT) - self.OFFSET
+
+    def get_units(self):
+        return self.get_value() / self.SCALE
+
+    def tare(self, times=15):
+        sum = self.read_average(times)
+        self.set_offset(sum)
+        self.save_calib()
+
+    def save_calib(self, path=CALIB_FILE):
+        # Keep OFFSET and SCALE across power cycles; a read-only or full
+        # filesystem just means the next boot tares again
+        try:
+            with open(path, "wb") as f:
+                f.write(struct.pack(CALIB_FORMAT, self.OFFSET, self.SCALE))
+        except OSError:
+            pass
+
+    def load_calib(self, path=CALIB_FILE):
+        # Restore OFFSET and SCALE written by save_calib(); False if none
+        try:
+            with open(path, "rb") as f:
+                data = f.read(struct.calcsize(CALIB_FORMAT))
+        except OSError:
+            return False
+        if len(data) != struct.calcsize(CALIB_FORMAT):
+            return False
+        self.OFFSET, self.SCALE = struct.unpack(CALIB_FORMAT, data)
+        return True
+
+    def set_scale(self, scale):
+        self.SCALE = scale
+
+    def set_offset(self, offset):
+        self.OFFSET = offset
+
+    def power_down(self):
+        if self.sm is not None:
+            # Take SCK back from PIO to drive it directly
+            self.sm.active(0)
+            self.pSCK.init(Pin.OUT)
+        self.pSCK.value(False)
+        self.pSCK.value(True)
+
+    def power_up(self):
+        self.pSCK.value(False)
+        self._ema = None  # Start smoothing afresh after the reset
+        if self.sm is not None:
+            self.init_sm()
+
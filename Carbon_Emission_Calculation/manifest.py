@@ -0,0 +1,20 @@
+# MicroPython frozen-module manifest for the Raspberry Pi Pico firmware.
+#
+# Freezing the display driver, font and HX711 driver into the firmware lets
+# them load straight from flash: no filesystem read or bytecode compile at
+# boot, and the font glyph table stays in ROM instead of the heap.
+#
+# Build (from a MicroPython checkout):
+#   cd ports/rp2
+#   make BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/Carbon_Emission_Calculation/manifest.py
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+module("st7789.py", opt=3)
+module("vga1_16x32.py", opt=3)
+module("hx711_gpio.py", opt=3)
+
+# Optionally freeze the main program too (DisplayManager, WeightSensor and
+# the main loop). Its code objects then live in flash rather than on the GC
+# heap. Start it from a two-line main.py, see README.
+# module("carbon_emissions_HX711.py", opt=3)
@@ -14,13 +14,13 @@ Features:
 """
 
 import os
+import re
 import time
-import base64
-import asyncio
 import logging
 from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
-from PIL import Image, ImageEnhance
+from functools import lru_cache
+from PIL import Image
 import cv2
 import numpy as np
 import google.generativeai as genai
@@ -43,6 +43,43 @@ except ImportError:
         confidence_threshold = 0.6
     ai_config = AIConfig()
 
+# JSON in API responses: a ```json fenced block, or a bare object with
+# at most one level of nested objects
+_JSON_FENCE_RE = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+
+# Number in a free-text weight such as "about 150g"
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+
+# Image enhancement factors (1.0 leaves the image unchanged)
+ENHANCE_BRIGHTNESS = 1.1
+ENHANCE_CONTRAST = 1.1
+ENHANCE_SHARPNESS = 1.05
+ENHANCE_COLOR = 1.05
+
+# Brightness per channel value; enhanced values are truncated like Pillow's
+_BRIGHTNESS_LUT = np.minimum(np.arange(256) * ENHANCE_BRIGHTNESS, 255).astype(np.uint8)
+
+# Sharpening blends each pixel with its 3x3 smoothed value (PIL's SMOOTH
+# weights); the blend folds into a single kernel
+_SMOOTH_KERNEL = np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], np.float32) / 13
+_SHARPEN_KERNEL = (1 - ENHANCE_SHARPNESS) * _SMOOTH_KERNEL
+_SHARPEN_KERNEL[1, 1] += ENHANCE_SHARPNESS
+
+# Colour enhancement blends each pixel with its grey (ITU-R 601 luma)
+# value; the blend folds into a single 3x3 colour matrix
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], np.float32)
+_COLOR_MATRIX = (ENHANCE_COLOR * np.eye(3, dtype=np.float32)
+                 + (1 - ENHANCE_COLOR) * _LUMA_WEIGHTS)
+
+
+@lru_cache(maxsize=256)
+def _brightness_contrast_lut(mean: int) -> np.ndarray:
+    """Lookup table applying brightness, then contrast around mean"""
+    lut = mean + ENHANCE_CONTRAST * (_BRIGHTNESS_LUT.astype(np.float32) - mean)
+    return np.clip(lut, 0, 255).astype(np.uint8)
+
+
 @dataclass
 class RecognitionResult:
     """
@@ -85,17 +122,19 @@ class ImageProcessor:
     def __init__(self):
         """Initialize image processor"""
         self.target_size = (ai_config.image_resize_width, ai_config.image_resize_height)
-        self.quality = 95
+        # JPEG quality of uploaded images; 85 keeps food detail for
+        # recognition at well under half the upload size of 95
+        self.quality = 85
         
-    def preprocess_image(self, image_path: str) -> str:
+    def preprocess_image(self, image_path: str) -> bytes:
         """
-        Preprocess image and convert to Base64
+        Preprocess image and encode it as JPEG
         
         Args:
             image_path (str): Image file path
             
         Returns:
-            str: Base64 encoded image data
+            bytes: JPEG image data
         """
         try:
             # Read image
@@ -105,16 +144,41 @@ class ImageProcessor:
                 # Assume numpy array
                 image = Image.fromarray(image_path)
             
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            
+        except Exception as e:
+            logging.error(f"Image preprocessing failed: {e}")
+            raise
+        
+        return self.preprocess_ndarray(np.asarray(image))
+    
+    def preprocess_ndarray(self, array: np.ndarray) -> bytes:
+        """
+        Preprocess an RGB image array and encode it as JPEG
+        
+        Enhancement and resizing work on the array; Pillow only sees the
+        result, for JPEG encoding.
+        
+        Args:
+            array (np.ndarray): RGB image data
+            
+        Returns:
+            bytes: JPEG image data
+        """
+        if array.dtype != np.uint8 or array.ndim != 3 or array.shape[2] != 3:
+            # Grey, RGBA and other layouts go through Pillow's conversion
+            return self.preprocess_image(array)
+        
+        try:
             # Image enhancement
-            enhanced_image = self._enhance_image(image)
+            enhanced = self._enhance_array(array)
             
             # Resize
-            resized_image = self._resize_image(enhanced_image)
+            resized = self._resize_array(enhanced)
             
-            # Convert to Base64
-            base64_data = self._image_to_base64(resized_image)
-            
-            return base64_data
+            # Convert to JPEG
+            return self._image_to_jpeg(Image.fromarray(resized))
             
         except Exception as e:
             logging.error(f"Image preprocessing failed: {e}")
@@ -130,23 +194,43 @@ class ImageProcessor:
         Returns:
             Image.Image: Enhanced image
         """
-        # Brightness enhancement
-        brightness_enhancer = ImageEnhance.Brightness(image)
-        enhanced = brightness_enhancer.enhance(1.1)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return Image.fromarray(self._enhance_array(np.asarray(image)))
+    
+    def _enhance_array(self, array: np.ndarray) -> np.ndarray:
+        """
+        Enhance an RGB uint8 image array
+        
+        Brightness, contrast, sharpness and colour are applied with OpenCV:
+        brightness and contrast as one lookup table, sharpening and colour
+        as single 3x3 passes.
         
-        # Contrast enhancement
-        contrast_enhancer = ImageEnhance.Contrast(enhanced)
-        enhanced = contrast_enhancer.enhance(1.1)
+        Args:
+            array (np.ndarray): Original image data
+            
+        Returns:
+            np.ndarray: Enhanced image data
+        """
+        # Brightness and contrast in one table lookup; contrast pivots on
+        # the mean grey level of the brightened image, taken from the
+        # channel histograms so the image is not brightened twice
+        pixels = array.shape[0] * array.shape[1]
+        channel_means = [
+            cv2.calcHist([array], [channel], None, [256], [0, 256]).ravel()
+            @ _BRIGHTNESS_LUT / pixels
+            for channel in range(3)
+        ]
+        mean = float(_LUMA_WEIGHTS @ channel_means)
+        enhanced = cv2.LUT(array, _brightness_contrast_lut(int(mean + 0.5)))
         
         # Sharpness
-        sharpness_enhancer = ImageEnhance.Sharpness(enhanced)
-        enhanced = sharpness_enhancer.enhance(1.05)
+        enhanced = cv2.filter2D(
+            enhanced, -1, _SHARPEN_KERNEL, borderType=cv2.BORDER_REPLICATE
+        )
         
         # Color enhancement
-        color_enhancer = ImageEnhance.Color(enhanced)
-        enhanced = color_enhancer.enhance(1.05)
-        
-        return enhanced
+        return cv2.transform(enhanced, _COLOR_MATRIX)
     
     def _resize_image(self, image: Image.Image) -> Image.Image:
         """
@@ -158,28 +242,49 @@ class ImageProcessor:
         Returns:
             Image.Image: Resized image
         """
-        # Maintain aspect ratio
-        image.thumbnail(self.target_size, Image.Resampling.LANCZOS)
-        
-        # Create white background
-        background = Image.new('RGB', self.target_size, (255, 255, 255))
-        
-        # Center image
-        offset = ((self.target_size[0] - image.size[0]) // 2,
-                 (self.target_size[1] - image.size[1]) // 2)
-        background.paste(image, offset)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return Image.fromarray(self._resize_array(np.asarray(image)))
+    
+    def _resize_array(self, array: np.ndarray) -> np.ndarray:
+        """
+        Fit an RGB image array into the target size on a white background
         
-        return background
+        Args:
+            array (np.ndarray): Original image data
+            
+        Returns:
+            np.ndarray: Resized image data
+        """
+        target_width, target_height = self.target_size
+        height, width = array.shape[:2]
+        
+        # Maintain aspect ratio; images are only ever shrunk, and INTER_AREA
+        # is OpenCV's resampling for shrinking
+        scale = min(target_width / width, target_height / height)
+        if scale < 1:
+            width = max(1, round(width * scale))
+            height = max(1, round(height * scale))
+            array = cv2.resize(array, (width, height), interpolation=cv2.INTER_AREA)
+        
+        # Center image; only the border strips are filled white
+        left = (target_width - width) // 2
+        top = (target_height - height) // 2
+        return cv2.copyMakeBorder(
+            array, top, target_height - height - top,
+            left, target_width - width - left,
+            cv2.BORDER_CONSTANT, value=(255, 255, 255)
+        )
     
-    def _image_to_base64(self, image: Image.Image) -> str:
+    def _image_to_jpeg(self, image: Image.Image) -> bytes:
         """
-        Convert image to Base64 encoding
+        Convert image to JPEG data
         
         Args:
             image (Image.Image): Image object
             
         Returns:
-            str: Base64 encoded string
+            bytes: JPEG encoded image
         """
         import io
         
@@ -187,12 +292,9 @@ class ImageProcessor:
         image.save(buffer, format='JPEG', quality=self.quality)
         buffer.seek(0)
         
-        image_data = buffer.getvalue()
-        base64_data = base64.b64encode(image_data).decode('utf-8')
-        
-        return base64_data
+        return buffer.getvalue()
     
-    def capture_from_camera(self, camera_index: int = 0) -> Optional[str]:
+    def capture_from_camera(self, camera_index: int = 0) -> Optional[bytes]:
         """
         Capture image from camera
         
@@ -200,7 +302,7 @@ class ImageProcessor:
             camera_index (int): Camera index
             
         Returns:
-            Optional[str]: Base64 encoded image data
+            Optional[bytes]: JPEG image data
         """
         try:
             # Initialize camera
@@ -214,10 +316,12 @@ class ImageProcessor:
             cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
             cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
             cap.set(cv2.CAP_PROP_FPS, 30)
+            # Keep only the newest frame queued
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             
-            # Warmup camera
+            # Warmup camera; grab() advances frames without decoding them
             for _ in range(5):
-                cap.read()
+                cap.grab()
             
             # Capture image
             ret, frame = cap.read()
@@ -227,15 +331,10 @@ class ImageProcessor:
                 logging.error("Cannot capture image")
                 return None
             
-            # Convert color space
+            # Convert color space and process
             frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             
-            # Convert to PIL image and process
-            pil_image = Image.fromarray(frame_rgb)
-            enhanced_image = self._enhance_image(pil_image)
-            resized_image = self._resize_image(enhanced_image)
-            
-            return self._image_to_base64(resized_image)
+            return self.preprocess_ndarray(frame_rgb)
             
         except Exception as e:
             logging.error(f"Camera capture failed: {e}")
@@ -280,6 +379,19 @@ class PromptGenerator:
 
         Focus on accuracy and use the most common English name for the food.
         """
+        
+        # Special instructions, appended after any weight or context hint
+        self.special_instructions = """
+        
+        Special instructions:
+        - If there are multiple foods in the image, identify the main food item
+        - If specific food cannot be determined, provide the most likely category
+        - Confidence should realistically reflect recognition accuracy
+        - Weight estimation should be reasonable, considering food density and volume
+        """
+        
+        # Prompt used when no weight or context is given, built once
+        self.default_prompt = self.base_prompt + self.special_instructions
     
     def generate_prompt(
         self, 
@@ -296,29 +408,24 @@ class PromptGenerator:
         Returns:
             str: Generated prompt
         """
-        prompt = self.base_prompt
+        # Without extra info the prompt never changes
+        if weight_info is None and not context:
+            return self.default_prompt
+        
+        parts = [self.base_prompt]
         
         # Add weight info
         if weight_info is not None:
-            weight_hint = f"\n\nKnown weight information: {weight_info:.1f}g, please analyze considering this information."
-            prompt += weight_hint
+            parts.append(f"\n\nKnown weight information: {weight_info:.1f}g, please analyze considering this information.")
         
         # Add context info
         if context:
-            context_hint = f"\n\nContext information: {context}"
-            prompt += context_hint
+            parts.append(f"\n\nContext information: {context}")
         
         # Add special instructions
-        prompt += """
+        parts.append(self.special_instructions)
         
-        Special instructions:
-        - If there are multiple foods in the image, identify the main food item
-        - If specific food cannot be determined, provide the most likely category
-        - Confidence should realistically reflect recognition accuracy
-        - Weight estimation should be reasonable, considering food density and volume
-        """
-        
-        return prompt
+        return "".join(parts)
 
 
 class VisionAI:
@@ -404,21 +511,20 @@ class VisionAI:
         try:
             # Preprocess image
             if isinstance(image_source, str):
-                base64_image = self.image_processor.preprocess_image(image_source)
+                image_data = self.image_processor.preprocess_image(image_source)
             else:
                 # numpy array
-                pil_image = Image.fromarray(image_source)
-                enhanced = self.image_processor._enhance_image(pil_image)
-                resized = self.image_processor._resize_image(enhanced)
-                base64_image = self.image_processor._image_to_base64(resized)
+                image_data = self.image_processor.preprocess_ndarray(image_source)
             
             # Generate cache key
-            cache_key = self._generate_cache_key(base64_image, weight_info, context)
+            cache_key = self._generate_cache_key(image_data, weight_info, context)
             
-            # Check cache
+            # Check cache; a hit is re-inserted as the newest entry, so
+            # eviction drops the least recently used result
             if cache_key in self.response_cache:
                 logging.info("Using cached recognition result")
-                cached_result = self.response_cache[cache_key]
+                cached_result = self.response_cache.pop(cache_key)
+                self.response_cache[cache_key] = cached_result
                 cached_result.processing_time = time.time() - start_time
                 return cached_result
             
@@ -426,7 +532,7 @@ class VisionAI:
             prompt = self.prompt_generator.generate_prompt(weight_info, context)
             
             # Call API
-            result = self._call_gemini_api(base64_image, prompt)
+            result = self._call_gemini_api(image_data, prompt)
             
             # Parse response
             recognition_result = self._parse_response(result, time.time() - start_time)
@@ -449,12 +555,12 @@ class VisionAI:
             # Return fallback result
             return self._create_fallback_result(str(e), time.time() - start_time)
     
-    def _call_gemini_api(self, base64_image: str, prompt: str) -> str:
+    def _call_gemini_api(self, image_data: bytes, prompt: str) -> str:
         """
         Call Gemini API
         
         Args:
-            base64_image (str): Base64 encoded image
+            image_data (bytes): JPEG image data
             prompt (str): Prompt
             
         Returns:
@@ -473,16 +579,13 @@ class VisionAI:
                 image_parts = [
                     {
                         "mime_type": "image/jpeg",
-                        "data": base64_image
+                        "data": image_data
                     }
                 ]
                 
-                # Send request
-                response = self.model.generate_content(
-                    [prompt] + image_parts,
-                    safety_settings=self.safety_settings,
-                    generation_config=self.generation_config
-                )
+                # Send request; safety settings and generation config were
+                # given to the model once when it was created
+                response = self.model.generate_content([prompt] + image_parts)
                 
                 if response.text:
                     return response.text
@@ -523,10 +626,9 @@ class VisionAI:
             # Weight info
             estimated_weight = data.get('estimated_weight')
             if isinstance(estimated_weight, str):
-                # Try to extract number from string
-                import re
-                numbers = re.findall(r'\d+\.?\d*', estimated_weight)
-                estimated_weight = float(numbers[0]) if numbers else None
+                # Try to extract number from string; only the first is used
+                number = _NUMBER_RE.search(estimated_weight)
+                estimated_weight = float(number.group()) if number else None
             
             # Quality assessment
             freshness = data.get('freshness')
@@ -572,15 +674,13 @@ class VisionAI:
         Returns:
             str: Extracted JSON string
         """
-        import re
-        
         # Try matching ```json ... ``` format
-        json_match = re.search(r'```json\s*(\{.*?\})\s*```', text, re.DOTALL)
+        json_match = _JSON_FENCE_RE.search(text)
         if json_match:
             return json_match.group(1)
         
         # Try matching {...} format
-        json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(text)
         if json_match:
             return json_match.group(0)
         
@@ -694,7 +794,7 @@ class VisionAI:
     
     def _generate_cache_key(
         self, 
-        base64_image: str, 
+        image_data: bytes, 
         weight_info: Optional[float], 
         context: Optional[str]
     ) -> str:
@@ -702,7 +802,7 @@ class VisionAI:
         Generate cache key
         
         Args:
-            base64_image (str): Base64 image data
+            image_data (bytes): JPEG image data
             weight_info (Optional[float]): Weight info
             context (Optional[str]): Context
             
@@ -711,15 +811,16 @@ class VisionAI:
         """
         import hashlib
         
-        # Calculate image hash
-        image_hash = hashlib.md5(base64_image.encode()).hexdigest()[:16]
+        # Calculate image hash; BLAKE2b is faster than MD5 in software and
+        # yields the short digest directly, without truncating a hex string
+        image_hash = hashlib.blake2b(image_data, digest_size=8).hexdigest()
         
         # Combine other info
         key_parts = [image_hash]
         if weight_info is not None:
             key_parts.append(f"w{weight_info:.1f}")
         if context:
-            key_parts.append(hashlib.md5(context.encode()).hexdigest()[:8])
+            key_parts.append(hashlib.blake2b(context.encode(), digest_size=4).hexdigest())
         
         return "_".join(key_parts)
     
@@ -733,7 +834,7 @@ class VisionAI:
         """
         # Limit cache size
         if len(self.response_cache) >= self.cache_max_size:
-            # Remove oldest entry
+            # Remove least recently used entry
             oldest_key = next(iter(self.response_cache))
             del self.response_cache[oldest_key]
         